@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import contextlib
 import enum
+import functools
+import sys
 import warnings
 import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-import dill
 import matplotlib as mpl
 import numpy as np
 import pyqtgraph as pg
@@ -22,6 +25,7 @@ from arpes.utilities.qt import (
     DataArrayImageView,
     SimpleApp,
     SimpleWindow,
+    load_tool_data,
     qt_info,
     run_tool_in_daemon_process,
 )
@@ -34,9 +38,11 @@ from PySide6.QtWidgets import QLayout, QWidget
 from .fit_inspection_plot import FitInspectionPlot
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
 
     from _typeshed import Incomplete
+    from numpy.typing import NDArray
 
 __all__ = (
     "FitTool",
@@ -44,6 +50,11 @@ __all__ = (
 )
 
 qt_info.setup_pyqtgraph()
+pg.setConfigOptions(useOpenGL=True, antialias=False)
+
+# The screen DPI is fixed once the application has started, and the tool only ever asks for a
+# handful of constant sizes.
+_inches_to_px = functools.lru_cache(maxsize=32)(qt_info.inches_to_px)
 
 
 class DataKey(enum.StrEnum):
@@ -56,6 +67,15 @@ class FitToolWindow(SimpleWindow):
     """The application window for `FitTool`."""
 
     HELP_DIALOG_CLS = BasicHelpDialog
+    SCROLL_COALESCE_MS = 16
+
+    def __init__(self) -> None:
+        """Configure the window and the timer used to coalesce key autorepeat scrolling."""
+        super().__init__()
+        self._pending_delta = [0, 0, 0, 0]
+        self._scroll_timer = QtCore.QTimer()
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.timeout.connect(self._flush_scroll)
 
     def compile_key_bindings(self) -> list[KeyBinding]:
         return [
@@ -95,7 +115,34 @@ class FitToolWindow(SimpleWindow):
 
         return delta
 
+    def _queue_scroll(self, delta: tuple[int, int]) -> None:
+        """Accumulate a scroll delta and (re)start the coalescing timer.
+
+        Holding an arrow key generates many key events per frame. Rather than redrawing every
+        marginal for each of them, we sum the deltas and dispatch a single scroll per axis once
+        the key events have quieted down for `SCROLL_COALESCE_MS`.
+        """
+        self._pending_delta[delta[0]] += delta[1]
+        self._scroll_timer.start(self.SCROLL_COALESCE_MS)
+
+    def _flush_scroll(self, *, draw: bool = True) -> None:
+        """Dispatch the accumulated scroll deltas to the application."""
+        pending = self._pending_delta
+        self._pending_delta = [0, 0, 0, 0]
+
+        if self.app() is None:
+            return
+
+        for axis, accumulated in enumerate(pending):
+            if accumulated:
+                self.app().scroll((axis, accumulated), draw=draw)
+
     def reset_intensity(self) -> None:
+        if self._scroll_timer.isActive():
+            # fold the queued scroll into the forced redraw rather than drawing twice
+            self._scroll_timer.stop()
+            self._flush_scroll(draw=False)
+
         self.app().reset_intensity()
 
     def scroll_z(self, event: QtGui.QKeyEvent) -> None:
@@ -107,7 +154,7 @@ class FitToolWindow(SimpleWindow):
         delta = self._update_scroll_delta(key_map.get(event.key()), event)
 
         if delta is not None and self.app() is not None:
-            self.app().scroll(delta)
+            self._queue_scroll(delta)
 
     def scroll(self, event: QtGui.QKeyEvent) -> None:
         key_map = {
@@ -120,7 +167,23 @@ class FitToolWindow(SimpleWindow):
         delta = self._update_scroll_delta(key_map.get(event.key(), (0, 0)), event)
 
         if delta is not None and self.app() is not None:
-            self.app().scroll(delta)
+            self._queue_scroll(delta)
+
+
+class ParameterHintRelay(QtCore.QObject):
+    """Carries parameter hints computed on a worker thread back to the GUI thread."""
+
+    hint_ready = QtCore.Signal(object)
+
+    def __init__(self) -> None:
+        """Deliver hints to the clipboard via a queued connection to this (GUI thread) object."""
+        super().__init__()
+        self.hint_ready.connect(self.copy_hint)
+
+    @QtCore.Slot(object)
+    def copy_hint(self, hint: object) -> None:
+        """Copy the computed hint, always on the thread owning this object."""
+        SimpleApp.copy_to_clipboard(hint)
 
 
 @dataclass
@@ -133,6 +196,7 @@ class FitTool(SimpleApp):
     TITLE = "Fit Tool"
     WINDOW_CLS = FitToolWindow
     WINDOW_SIZE = (8, 5)
+    SLICE_CACHE_SIZE = 8
 
     def __init__(self) -> None:
         """Initialize attributes to safe empty values."""
@@ -140,6 +204,19 @@ class FitTool(SimpleApp):
 
         self.content_layout = None
         self.main_layout = None
+        self._weak_self = weakref.ref(self)
+        self._hint_relay = ParameterHintRelay()
+        self._configure_fn: Callable[[], None] = lambda: None
+        self._slice_cache: OrderedDict[tuple, xr.DataArray] = OrderedDict()
+        self._last_slice_ids: dict[tuple[int, ...], tuple] = {}
+        self._last_images: dict[tuple[int, ...], xr.DataArray] = {}
+        self._data_np: NDArray[np.float32] | None = None
+        self._dims_tuple: tuple[str, ...] = ()
+        self._dim_to_axis: dict[str, int] = {}
+        self._coord_c0: NDArray[np.float64] = np.zeros(0)
+        self._coord_dc: NDArray[np.float64] = np.zeros(0)
+        self._dim_fmt = ""
+        self._dim_lens: list[int] = []
 
     @property
     def data(self) -> xr.Dataset:
@@ -152,17 +229,46 @@ class FitTool(SimpleApp):
         msg = "On fit_tool, the data is computed from the original dataset."
         raise TypeError(msg)
 
-    def center_cursor(self) -> None:
-        """Scrolls so that the cursors are in the center of the data volume."""
+    @contextlib.contextmanager
+    def _batch_cursor_updates(self) -> Iterator[None]:
+        """Silence the registered cursors while several of them are moved programmatically.
+
+        The caller is responsible for redrawing once afterwards, so that moving N cursors costs
+        a single update rather than N re-entrant ones.
+        """
+        cursors = [c for cs in self.registered_cursors.values() for c in cs]
+        for c in cursors:
+            c.blockSignals(True)
+        try:
+            yield
+        finally:
+            for c in cursors:
+                c.blockSignals(False)
+
+    def _move_cursors(self, new_cursor: list[float]) -> None:
+        """Place every registered cursor at `new_cursor` without triggering redraws."""
+        with self._batch_cursor_updates():
+            for i, cursors in self.registered_cursors.items():
+                for cursor in cursors:
+                    cursor.set_location(new_cursor[i])
+
+    def center_cursor(self, *, draw: bool = True) -> None:
+        """Scrolls so that the cursors are in the center of the data volume.
+
+        With `draw=False` only the cursor state is updated and redrawing is left to the caller.
+        """
         new_cursor = [len(self.data.coords[d]) / 2 for d in self.data.dims]
-        self.update_cursor_position(new_cursor)
+        if draw:
+            self.update_cursor_position(new_cursor)
+        else:
+            self.context["cursor"] = new_cursor
+        self._move_cursors(new_cursor)
 
-        for i, cursors in self.registered_cursors.items():
-            for cursor in cursors:
-                cursor.set_location(new_cursor[i])
+    def scroll(self, delta: Iterable[float], *, draw: bool = True) -> None:
+        """Scroll the axis delta[0] by delta[1] pixels.
 
-    def scroll(self, delta: Iterable[float]) -> None:
-        """Scroll the axis delta[0] by delta[1] pixels."""
+        With `draw=False` only the cursor state is updated and redrawing is left to the caller.
+        """
         if delta[0] >= len(self.context["cursor"]):
             warnings.warn("Tried to scroll a non-existent dimension.", stacklevel=2)
             return
@@ -170,33 +276,89 @@ class FitTool(SimpleApp):
         cursor = list(self.context["cursor"])
         cursor[delta[0]] += delta[1]
 
-        self.update_cursor_position(cursor)
+        if draw:
+            self.update_cursor_position(cursor)
+        else:
+            self.context["cursor"] = cursor
+        self._move_cursors(cursor)
 
-        for i, cursors in self.registered_cursors.items():
-            for c in cursors:
-                c.set_location(cursor[i])
+    def _refresh_np_cache(self) -> None:
+        """Cache a contiguous NumPy copy of the data so that slicing skips xarray dispatch.
+
+        The copy is single precision: pyqtgraph does not need more for display, and halving the
+        bytes halves the traffic through the histogram and lookup table on every redraw. The
+        underlying dataset is left untouched.
+        """
+        self._data_np = np.ascontiguousarray(self.data.values, dtype=np.float32)
+        self._dims_tuple = tuple(self.data.dims)
+        self._dim_to_axis = {d: i for i, d in enumerate(self._dims_tuple)}
+        self._dim_lens = list(self._data_np.shape)
+
+        # the coordinates are assumed to be evenly spaced, so index -> value is affine
+        coords = [self.data.coords[d].values for d in self._dims_tuple]
+        self._coord_c0 = np.array([c[0] for c in coords])
+        self._coord_dc = np.array([c[1] - c[0] for c in coords])
+        self._dim_fmt = ",".join(f"{d}: {{:.4g}}" for d in self._dims_tuple)
+
+    def _selection_key(self, select_coord: dict[str, slice]) -> tuple:
+        """A hashable description of the data currently selected by `select_coord`."""
+        return (
+            self.data_key.value,
+            self._dims_tuple,
+            tuple(sorted((k, s.start, s.stop) for k, s in select_coord.items())),
+        )
+
+    def marginal_for(self, select_coord: dict[str, slice]) -> xr.DataArray:
+        """Select and average the data over `select_coord`, memoizing recent results.
+
+        Users tend to scroll back and forth over the same few positions, so we keep the last
+        `SLICE_CACHE_SIZE` marginals around instead of re-slicing the data every time.
+        """
+        key = self._selection_key(select_coord)
+        cached = self._slice_cache.get(key)
+        if cached is not None:
+            self._slice_cache.move_to_end(key)
+            return cached
+
+        assert self._data_np is not None
+        values = self._data_np[tuple(select_coord.get(d, slice(None)) for d in self._dims_tuple)]
+        axes = tuple(self._dim_to_axis[d] for d in select_coord)
+        if all(sl.stop - sl.start == 1 for sl in select_coord.values()):
+            # single-step cursors select one pixel per axis, so averaging is just a squeeze
+            values = np.squeeze(values, axis=axes)
+        else:
+            # match xarray's default of skipping NaN when averaging
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = np.nanmean(values, axis=axes)
+
+        remaining_dims = [d for d in self._dims_tuple if d not in select_coord]
+        marginal = xr.DataArray(
+            values,
+            coords={d: self.data.coords[d].values for d in remaining_dims},
+            dims=remaining_dims,
+        )
+
+        self._slice_cache[key] = marginal
+        if len(self._slice_cache) > self.SLICE_CACHE_SIZE:
+            self._slice_cache.popitem(last=False)
+        return marginal
 
     def transpose(self, transpose_order: list[str]) -> None:
         """Transpose dimensions into the order specified by `transpose_order` and redraw."""
         reindex_order = [self.data.dims.index(t) for t in transpose_order]
         self.data = self.data.transpose(*transpose_order)
+        self._refresh_np_cache()
 
         new_cursor = [self.context["cursor"][i] for i in reindex_order]
         self.update_cursor_position(new_cursor, force=True)
-
-        for i, cursors in self.registered_cursors.items():
-            for cursor in cursors:
-                cursor.set_location(new_cursor[i])
+        self._move_cursors(new_cursor)
 
     def transpose_to_front(self, dim: str | int) -> None:
         """Transpose the dimension `dim` to the front so that it is in the main marginal."""
-        if not isinstance(dim, str):
-            dim = tuple(self.data.dims).index(dim)
-
-        order = list(self.data.dims)
-        order.remove(dim)
-        order = [dim, *order]
-        self.transpose(order)
+        dims = self._dims_tuple
+        idx = self._dim_to_axis[dim] if isinstance(dim, str) else dim % len(dims)
+        self.transpose([dims[idx], *dims[:idx], *dims[idx + 1 :]])
 
     def configure_image_widgets(self) -> None:
         """Configure array marginals for the input data.
@@ -231,40 +393,45 @@ class FitTool(SimpleApp):
 
             The 1D marginal will have a cursor and binning controls on that cursor.
         """
-        if len(self.data.dims) == TWO_DIMENSION:
-            self.generate_marginal_for((), 0, 0, "xy", cursors=True, layout=self.content_layout)
-            self.generate_fit_marginal_for(
-                (0, 1),
-                (0, 1),
-                "fit",
-                cursors=False,
-                orientation=PlotOrientation.Vertical,
-                layout=self.content_layout,
-            )
-            self.views["xy"].view.setYLink(self.views["fit"].inner_plot)
-
-        if len(self.data.dims) == TWO_DIMENSION + 1:
-            self.generate_marginal_for((2,), 1, 0, "xy", cursors=True, layout=self.content_layout)
-            self.generate_fit_marginal_for(
-                (0, 1, 2),
-                (0, 0),
-                "fit",
-                cursors=True,
-                layout=self.content_layout,
-            )
+        self._configure_fn()
+
+    def _configure_2d(self) -> None:
+        """One dimensional marginals: a single image of all the data beside the fit display."""
+        self.generate_marginal_for((), 0, 0, "xy", cursors=True, layout=self.content_layout)
+        self.generate_fit_marginal_for(
+            (0, 1),
+            (0, 1),
+            "fit",
+            cursors=False,
+            orientation=PlotOrientation.Vertical,
+            layout=self.content_layout,
+        )
+        self.views["xy"].view.setYLink(self.views["fit"].inner_plot)
+
+    def _configure_3d(self) -> None:
+        """Two dimensional marginals: one image with the fit axis out of the image plane."""
+        self.generate_marginal_for((2,), 1, 0, "xy", cursors=True, layout=self.content_layout)
+        self.generate_fit_marginal_for(
+            (0, 1, 2),
+            (0, 0),
+            "fit",
+            cursors=True,
+            layout=self.content_layout,
+        )
 
-        if len(self.data.dims) == 4:  # noqa: PLR2004
-            # no idea if these marginal locations are correct, need to check that
-            self.generate_marginal_for((1, 3), 1, 0, "xz", cursors=True, layout=self.content_layout)
-            self.generate_marginal_for((2, 3), 0, 1, "xy", cursors=True, layout=self.content_layout)
-            self.generate_marginal_for((0, 3), 1, 1, "yz", layout=self.content_layout)
-            self.generate_fit_marginal_for(
-                (0, 1, 2, 3),
-                (0, 0),
-                "fit",
-                cursors=True,
-                layout=self.content_layout,
-            )
+    def _configure_4d(self) -> None:
+        """Three dimensional marginals: the standard set of marginal planes and the fit display."""
+        # no idea if these marginal locations are correct, need to check that
+        self.generate_marginal_for((1, 3), 1, 0, "xz", cursors=True, layout=self.content_layout)
+        self.generate_marginal_for((2, 3), 0, 1, "xy", cursors=True, layout=self.content_layout)
+        self.generate_marginal_for((0, 3), 1, 1, "yz", layout=self.content_layout)
+        self.generate_fit_marginal_for(
+            (0, 1, 2, 3),
+            (0, 0),
+            "fit",
+            cursors=True,
+            layout=self.content_layout,
+        )
 
     def generate_fit_marginal_for(  # noqa: PLR0913
         self,
@@ -289,13 +456,13 @@ class FitTool(SimpleApp):
         remaining_dims = [_ for _ in list(range(len(self.data.dims))) if _ not in dimensions]
 
         # for now, we only allow a single fit dimension
-        widget = FitInspectionPlot(name=name, root=weakref.ref(self), orientation=orientation)
+        widget = FitInspectionPlot(name=name, root=self._weak_self, orientation=orientation)
         self.views[name] = widget
 
         if orientation == PlotOrientation.Horizontal:
-            widget.setMaximumHeight(qt_info.inches_to_px(3))
+            widget.setMaximumHeight(_inches_to_px(3))
         else:
-            widget.setMaximumWidth(qt_info.inches_to_px(3))
+            widget.setMaximumWidth(_inches_to_px(3))
 
         if cursors:
             cursor = CursorRegion(
@@ -333,33 +500,31 @@ class FitTool(SimpleApp):
         old_cursor = list(self.context["cursor"])
         self.context["cursor"] = new_cursor
 
-        def index_to_value(index: int, dim: str) -> float:
-            d = self.data.dims[dim]
-            c = self.data.coords[d].values
-            return c[0] + index * (c[1] - c[0])
-
-        self.context["value_cursor"] = [index_to_value(v, i) for i, v in enumerate(new_cursor)]
+        self.context["value_cursor"] = (
+            self._coord_c0 + np.asarray(new_cursor) * self._coord_dc
+        ).tolist()
 
-        changed_dimensions = [
-            i for i, (x, y) in enumerate(zip(old_cursor, new_cursor, strict=True)) if x != y
-        ]
+        changed_dimensions = np.flatnonzero(
+            np.asarray(old_cursor) != np.asarray(new_cursor)
+        ).tolist()
 
-        cursor_text = ",".join(
-            f"{x}: {y:.4g}"
-            for x, y in zip(self.data.dims, self.context["value_cursor"], strict=True)
-        )
+        cursor_text = self._dim_fmt.format(*self.context["value_cursor"])
         self.window.statusBar().showMessage(f"({cursor_text})")
 
+        if not changed_dimensions and not force:
+            return
+
+        changed_set = set(changed_dimensions)
+
         # update data
         def safe_slice(vlow: float, vhigh: float, axis: int = 0) -> slice:
+            # builtins rather than np.clip: these are Python scalars on a per-keypress path
             vlow, vhigh = int(min(vlow, vhigh)), int(max(vlow, vhigh))
-            rng = len(self.data.coords[self.data.dims[axis]])
-            vlow, vhigh = np.clip(vlow, 0, rng), np.clip(vhigh, 0, rng)
+            rng = self._dim_lens[axis]
+            vlow, vhigh = min(max(vlow, 0), rng), min(max(vhigh, 0), rng)
 
             if vlow == vhigh:
-                vhigh = vlow + 1
-
-            vlow, vhigh = np.clip(vlow, 0, rng), np.clip(vhigh, 0, rng)
+                vhigh = min(vlow + 1, rng)
 
             if vlow == vhigh:
                 vlow = vhigh - 1
@@ -367,24 +532,44 @@ class FitTool(SimpleApp):
             return slice(vlow, vhigh)
 
         for reactive in self.reactive_views:
-            if set(reactive.dims).intersection(set(changed_dimensions)) or force:
+            if force or changed_set.intersection(reactive.dims):
                 try:
-                    select_coord = dict(
-                        zip(
-                            [self.data.dims[i] for i in reactive.dims],
-                            [
-                                safe_slice(int(new_cursor[i]), int(new_cursor[i] + 1), i)
-                                for i in reactive.dims
-                            ],
-                            strict=True,
-                        ),
-                    )
+                    select_coord = {
+                        self._dims_tuple[i]: safe_slice(
+                            int(new_cursor[i]),
+                            int(new_cursor[i] + 1),
+                            i,
+                        )
+                        for i in reactive.dims
+                    }
                     assert isinstance(self.dataset, xr.Dataset)
                     if isinstance(reactive.view, DataArrayImageView):
-                        image_data = self.data.isel(select_coord)
-                        if select_coord:
-                            image_data = image_data.mean(list(select_coord.keys()))
-                        reactive.view.setImage(image_data, keep_levels=keep_levels)
+                        # moving the cursor within a bin does not change the image
+                        slice_key = self._selection_key(select_coord)
+                        if not force and self._last_slice_ids.get(reactive.dims) == slice_key:
+                            continue
+                        self._last_slice_ids[reactive.dims] = slice_key
+
+                        image_data = self.marginal_for(select_coord)
+
+                        # neighbouring slices are frequently identical (e.g. padding or masked
+                        # regions), in which case the displayed image does not need to change
+                        last_image = self._last_images.get(reactive.dims)
+                        if (
+                            not force
+                            and last_image is not None
+                            and last_image.dims == image_data.dims
+                            and np.array_equal(last_image.values, image_data.values, equal_nan=True)
+                        ):
+                            continue
+                        self._last_images[reactive.dims] = image_data
+
+                        reactive.view.setImage(
+                            image_data,
+                            keep_levels=keep_levels,
+                            autoLevels=not keep_levels,
+                            autoHistogramRange=not keep_levels,
+                        )
                     elif isinstance(reactive.view, FitInspectionPlot):
                         results_coord = {
                             k: v for k, v in select_coord.items() if k in self.dataset.results.dims
@@ -394,18 +579,12 @@ class FitTool(SimpleApp):
                         reactive.view.set_model_result(result)
 
                     elif isinstance(reactive.view, pg.PlotWidget):
-                        for_plot = self.data.isel(select_coord)
-                        if select_coord:
-                            for_plot = for_plot.mean(list(select_coord.keys()))
-
-                        cursors = [
-                            _
-                            for _ in reactive.view.getPlotItem().items
-                            if isinstance(_, CursorRegion)
-                        ]
-                        reactive.view.clear()
-                        for c in cursors:
-                            reactive.view.addItem(c)
+                        for_plot = self.marginal_for(select_coord)
+
+                        # drop the previous curves only, cursors stay attached to the plot
+                        plot_item = reactive.view.getPlotItem()
+                        for data_item in plot_item.listDataItems():
+                            plot_item.removeItem(data_item)
 
                         if isinstance(reactive.view, DataArrayPlot):
                             reactive.view.plot(for_plot)
@@ -421,20 +600,25 @@ class FitTool(SimpleApp):
     def construct_binning_tab(self) -> QWidget:
         """Gives tab controls for the axis along the fit only."""
         inner_items = [
-            BinningInfoWidget(axis_index=len(self.data.dims) - 1, root=weakref.ref(self)),
+            BinningInfoWidget(axis_index=len(self.data.dims) - 1, root=self._weak_self),
         ]
         return horizontal(label("Options"), *inner_items), inner_items
 
     def copy_parameter_hint(self, *_: Incomplete) -> None:
         """Converts parameters for the current model being displayed and copies to clipboard."""
         result = self.views["fit"].result
-        hint = result_to_hints(result)
-        self.copy_to_clipboard(hint)
+        relay = self._hint_relay
+
+        # composite models can take a while to convert, so keep the GUI thread free
+        def compute_hint() -> None:
+            relay.hint_ready.emit(result_to_hints(result))
+
+        QtCore.QThreadPool.globalInstance().start(compute_hint)
 
     def construct_info_tab(self) -> QWidget:
         """Provides some utility functionality to make curve fitting easier."""
         copy_button = button("Copy parameters as hint")
-        copy_button.setMaximumWidth(qt_info.inches_to_px(1.5))
+        copy_button.setMaximumWidth(_inches_to_px(1.5))
         copy_button.subject.subscribe(self.copy_parameter_hint)
         inner_items = [copy_button]
         return horizontal(*inner_items), inner_items
@@ -447,7 +631,7 @@ class FitTool(SimpleApp):
         binning_tab, self.binning_tab_widgets = self.construct_binning_tab()
 
         self.tabs = tabs(("Info", info_tab), ("Binning", binning_tab))
-        self.tabs.setFixedHeight(qt_info.inches_to_px(1))
+        self.tabs.setFixedHeight(_inches_to_px(1))
 
         self.main_layout.addLayout(self.content_layout, 0, 0)
         self.main_layout.addWidget(self.tabs, 1, 0)
@@ -463,6 +647,15 @@ class FitTool(SimpleApp):
         self.configure_image_widgets()
         self.add_contextual_widgets()
 
+        for view in self.views.values():
+            if isinstance(view, DataArrayImageView):
+                graphics_view = view.ui.graphicsView
+                graphics_view.setViewportUpdateMode(
+                    QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate,
+                )
+                graphics_view.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+                view.getImageItem().setAutoDownsample(True)
+
         self.set_colormap(mpl.colormaps["viridis"])
 
     def after_show(self) -> None:
@@ -478,9 +671,9 @@ class FitTool(SimpleApp):
             },
         )
 
-        # Display the data
+        # Display the data, centering first so that we only render once
+        self.center_cursor(draw=False)
         self.update_cursor_position(self.context["cursor"], force=True, keep_levels=False)
-        self.center_cursor()
 
     def reset_intensity(self) -> None:
         """Autoscales intensity in each marginal plot."""
@@ -490,17 +683,31 @@ class FitTool(SimpleApp):
         """Sets the current data to a new value and resets UI state."""
         self.dataset = data
         self.data_key = DataKey.Data
+        self._slice_cache.clear()
+        self._last_slice_ids.clear()
+        self._last_images.clear()
 
         # For now, we only support 1D fit results
         fit_dims = self.dataset.F.fit_dimensions
         assert len(fit_dims) == 1
         self.dataset = self.dataset.S.transpose_to_back(*fit_dims)
+        self._refresh_np_cache()
+
+        self._configure_fn = {
+            TWO_DIMENSION: self._configure_2d,
+            TWO_DIMENSION + 1: self._configure_3d,
+            TWO_DIMENSION + 2: self._configure_4d,
+        }.get(len(self.data.dims), lambda: None)
 
 
-def _fit_tool(data: xr.Dataset) -> None:
+def _fit_tool(data: xr.Dataset | Path | bytes) -> None:
     """Starts the fitting inspection tool using an input fit result Dataset."""
-    with contextlib.suppress(TypeError):
-        data = dill.loads(data)  # noqa: S301
+    # Unpickling a large fit result can take seconds; overlap it with bringing up Qt,
+    # which does not depend on the data. The window itself needs the data for its layout.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(load_tool_data, data)
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+        data = pending.result()
 
     # some sanity checks that we were actually passed a collection of fit results
     assert isinstance(data, xr.Dataset)
@@ -508,7 +715,7 @@ def _fit_tool(data: xr.Dataset) -> None:
 
     tool = FitTool()
     tool.set_data(data)
-    tool.start()
+    tool.start(app=app)
 
 
 fit_tool = run_tool_in_daemon_process(_fit_tool)
@@ -3,13 +3,11 @@
 # pylint: disable=import-error
 from __future__ import annotations
 
-import contextlib
 import warnings
 import weakref
 from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
 from typing import TYPE_CHECKING
 
-import dill
 import matplotlib as mpl
 import numpy as np
 import pyqtgraph as pg
@@ -21,6 +19,7 @@ from arpes.utilities.qt import (
     DataArrayImageView,
     SimpleApp,
     SimpleWindow,
+    load_tool_data,
     qt_info,
     run_tool_in_daemon_process,
 )
@@ -549,8 +548,7 @@ class QtTool(SimpleApp):
 
 def _qt_tool(data: xr.DataArray, **kwargs: Incomplete) -> None:
     """Starts the qt_tool using an input spectrum."""
-    with contextlib.suppress(TypeError):
-        data = dill.loads(data)  # noqa: S301
+    data = load_tool_data(data)
 
     tool = QtTool()
     tool.set_data(data)
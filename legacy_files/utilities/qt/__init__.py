@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import functools
+import tempfile
 from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
 from multiprocessing import Process
+from pathlib import Path
 from typing import TYPE_CHECKING, ParamSpec, TypeVar
 
 import dill
@@ -32,6 +34,7 @@ __all__ = (
     "DataArrayImageView",
     "SimpleApp",
     "SimpleWindow",
+    "load_tool_data",
     "qt_info",
     "remove_dangling_viewboxes",
     "run_tool_in_daemon_process",
@@ -81,14 +84,36 @@ def run_tool_in_daemon_process(tool_handler: Callable[P, None]) -> Callable[P, N
             # causes dill to crash after loading an nc array
             data = data.assign_coords(data.coords)
 
-        ser_data = dill.dumps(data)
-        p = Process(target=tool_handler, args=(ser_data,), kwargs=kwargs, daemon=True)
+        # Hand the data over through a file rather than a bytes argument, so that neither
+        # process needs to hold a second full copy of the pickle in memory.
+        with tempfile.NamedTemporaryFile(suffix=".pickle", delete=False) as f:
+            dill.dump(data, f)
+        p = Process(target=tool_handler, args=(Path(f.name),), kwargs=kwargs, daemon=True)
         p.start()
         return None
 
     return wrapped_handler
 
 
+def load_tool_data(data: XrTypes | Path | bytes) -> XrTypes:
+    """Recover the data handed to a tool by `run_tool_in_daemon_process`.
+
+    Detached tools receive the path of a pickle file, which is streamed with `dill.load` and then
+    removed. Serialized bytes are also accepted, and anything else is returned unchanged.
+    """
+    if isinstance(data, Path):
+        try:
+            with data.open("rb") as f:
+                return dill.load(f)  # noqa: S301
+        finally:
+            data.unlink(missing_ok=True)
+
+    if isinstance(data, bytes):
+        return dill.loads(data)  # noqa: S301
+
+    return data
+
+
 def remove_dangling_viewboxes() -> None:
     """Remove ViewBoxes that don't get garbage collected on app close.
 
@@ -13,6 +13,7 @@ from .decomposition import (
 )
 from .deconvolution import deconvolve_ice, deconvolve_rl, make_psf1d
 from .derivative import (
+    DerivativeCache,
     curvature1d,
     curvature2d,
     d1_along_axis,
@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
-import contextlib
 import functools
+import itertools
 import operator
-from itertools import pairwise, permutations, product
+import os
+from dataclasses import dataclass, field
 from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
 from typing import TYPE_CHECKING, Any, Literal, Required, TypedDict
 
-import lmfit as lf
+import dill
+import numba
 import numpy as np
 import xarray as xr
-from scipy.spatial import distance
+from scipy.optimize import linear_sum_assignment
 
 import arpes.utilities.math
 from arpes.constants import HBAR_SQ_EV_PER_ELECTRON_MASS_ANGSTROM_SQ, TWO_DIMENSION
 from arpes.fits import AffineBackgroundModel, LorentzianModel, QuadraticModel, broadcast_model
+from arpes.fits.hot_pool import hot_pool
 from arpes.models.band import Band
 from arpes.provenance import update_provenance
 from arpes.utilities.conversion.forward import convert_coordinates_to_kspace_forward
@@ -25,6 +28,7 @@ from arpes.utilities.jupyter import wrap_tqdm
 if TYPE_CHECKING:
     from collections.abc import Hashable, Iterator
 
+    import lmfit as lf
     from _typeshed import Incomplete
     from lmfit import Parameter
     from lmfit.model import ModelResult
@@ -152,75 +156,50 @@ def unpack_bands_from_fit(
         weights=weights,
     )
 
+    flat_results: NDArray[np.object_] = band_results.values.ravel()
+    param_names = ("center", "amplitude", "sigma", "gamma")
+    # full parameter names of each band, identified_band_results stores only the prefixes
+    full_names = {
+        prefix: [prefix + param_name for param_name in param_names]
+        for prefix in identified_band_results[0]
+    }
+
     bands: list[Band] = []
     for i in range(len(band_names)):
         label = identified_band_results[0][i]
 
-        def dataarray_for_value(
-            param_name: Literal["center", "amplitude", "sigma", "gamma"],
-            i: int = i,
-            *,
-            is_value: bool,
-        ) -> xr.DataArray | None:
-            """Return DataArray representing the fit results.
-
-            Args:
-                param_name (Literal["center", "amplitude", "sigma", "gamma"]): [TODO:description]
-                i (int): index for band names in identified_band_results.
-                is_value (bool): if True, return the value, else return stderr.
-
-            Returns: xr.DataArray | None
-                DataArray storing the fitting data. if the corresponding parameter name is not used,
-                returns None.
-            """
-            values: NDArray[np.float64] = np.zeros_like(
-                band_results.values,
-                dtype=float,
-            )
-            with np.nditer(values, flags=["multi_index"], op_flags=[["writeonly"]]) as it:
-                while not it.finished:
-                    prefix = identified_band_results[it.multi_index][i]
-                    try:
-                        param = band_results.values[it.multi_index].params[prefix + param_name]
-                        it[0] = param.value if is_value else param.stderr
-                    except KeyError:
-                        return None
-                    finally:
-                        it.iternext()
-            return band_results.G.with_values(values, keep_attrs=False)
+        # (value, stderr) of each parameter, gathered in a single pass over the results, which
+        # are ordered as iter_coords, i.e. as identified_band_results.
+        values: NDArray[np.float64] = np.empty((len(param_names), 2, len(flat_results)))
+        is_used = [True] * len(param_names)
+        for j, (fit_result, prefixes) in enumerate(
+            zip(flat_results, identified_band_results, strict=True),
+        ):
+            params = fit_result.params
+            for k, name in enumerate(full_names[prefixes[i]]):
+                if not is_used[k]:
+                    continue
+                param: Parameter | None = params.get(name)
+                if param is None:
+                    # the parameter is not used by this band
+                    is_used[k] = False
+                    continue
+                values[k, 0, j], values[k, 1, j] = param.value, param.stderr
 
         band_data = xr.Dataset({})
-        center = dataarray_for_value(param_name="center", is_value=True)
-        if center is not None:
-            band_data.update(
-                {
-                    "center": center,
-                    "center_stderr": dataarray_for_value(param_name="center", is_value=False),
-                },
-            )
-
-        amplitude = dataarray_for_value(param_name="amplitude", is_value=True)
-        if amplitude is not None:
-            band_data.update(
-                {
-                    "amplitude": amplitude,
-                    "amplitude_stderr": dataarray_for_value(param_name="amplitude", is_value=False),
-                },
-            )
-        sigma = dataarray_for_value(param_name="sigma", is_value=True)
-        if sigma is not None:
-            band_data.update(
-                {
-                    "sigma": sigma,
-                    "sigma_stderr": dataarray_for_value(param_name="sigma", is_value=False),
-                },
-            )
-        gamma = dataarray_for_value(param_name="gamma", is_value=True)
-        if gamma is not None:
+        for k, param_name in enumerate(param_names):
+            if not is_used[k]:
+                continue
             band_data.update(
                 {
-                    "gamma": gamma,
-                    "gamma_stderr": dataarray_for_value(param_name="gamma", is_value=False),
+                    param_name: band_results.G.with_values(
+                        values[k, 0].reshape(band_results.shape),
+                        keep_attrs=False,
+                    ),
+                    f"{param_name}_stderr": band_results.G.with_values(
+                        values[k, 1].reshape(band_results.shape),
+                        keep_attrs=False,
+                    ),
                 },
             )
 
@@ -247,104 +226,158 @@ def _identified_band_results(
     """
     band_results = band_results if isinstance(band_results, xr.DataArray) else band_results.results
     prefixes: list[str] = [
-        component.prefix for component in band_results.values[0].model.components
+        component.prefix for component in band_results.values.flat[0].model.components
+    ]
+    # parameter names of each band, built once rather than for every point
+    param_names = [
+        (prefix + "sigma", prefix + "gamma", prefix + "amplitude", prefix + "center")
+        for prefix in prefixes
     ]
     identified_band_results: list[list[str]] = []
-    identified_by_coordinate: dict[tuple[float, ...], tuple[list[str], ModelResult]] = {}
-    for coordinate in band_results.G.iter_coords():
-        fit_result: ModelResult = band_results.loc[coordinate].values.item()
-        frozen_coord: tuple[float, ...] = tuple(coordinate[d] for d in band_results.dims)
+    # coordinates (row-wise) of every point, in the order of iter_coords and of the flat results
+    all_coords: NDArray[np.float64] = np.stack(
+        np.meshgrid(
+            *[band_results.coords[d].values.astype(float) for d in band_results.dims],
+            indexing="ij",
+        ),
+        axis=-1,
+    ).reshape(band_results.size, band_results.ndim)
+    # weighted band vectors of each labelled point, rows in the order of `prefixes`
+    identified: list[tuple[list[str], NDArray[np.float64]]] = []
+    fit_result: ModelResult
+    for fit_result, frozen_coord in zip(band_results.values.flat, all_coords, strict=True):
         logger.debug(f"frozen_coord: {frozen_coord}")
-        closest_identified: tuple[list[str], ModelResult] | None = None
-        dist = np.inf
-        for coord, identified_band in identified_by_coordinate.items():
-            current_dist = np.dot(coord, frozen_coord)
-            if current_dist < dist:
-                closest_identified = identified_band
-                dist = current_dist
-        if closest_identified is None:
-            closest_identified = (
-                [c.prefix for c in fit_result.model.components],
-                fit_result,
-            )
-            logger.debug(f"closest_identified: {closest_identified}")
-            identified_by_coordinate[frozen_coord] = closest_identified
-        closest_prefixes, closest_fit = closest_identified
-        mat_shape: tuple[int, int] = (len(prefixes), len(prefixes))
-        dist_mat: NDArray[np.float64] = np.zeros(shape=mat_shape)
-        for i, prefix_i in enumerate(prefixes):
-            for j, prefix_j in enumerate(closest_prefixes):
-                dist_mat[i, j] = distance.euclidean(
-                    _modelresult_to_array(
-                        model_fit=fit_result,
-                        prefix=prefix_i,
-                        weights=weights,
-                    ),
-                    _modelresult_to_array(
-                        model_fit=closest_fit,
-                        prefix=prefix_j,
-                        weights=weights,
-                    ),
-                )
-
-        best_arrangement: tuple[int, ...] = min(
-            permutations(range(len(prefixes))),
-            key=lambda p: sum(dist_mat[i, p_i] for i, p_i in enumerate(p)),
+        current_vectors = _modelresult_to_vectors(
+            model_fit=fit_result,
+            param_names=param_names,
+            weights=weights,
         )
+        if identified:
+            delta = all_coords[: len(identified)] - frozen_coord
+            closest_prefixes, closest_vectors = identified[
+                int(np.einsum("ij,ij->i", delta, delta).argmin())
+            ]
+        else:
+            closest_prefixes = [c.prefix for c in fit_result.model.components]
+            closest_vectors = current_vectors
+            logger.debug(f"closest_identified: {closest_prefixes}")
+        diff = current_vectors[:, np.newaxis, :] - closest_vectors[np.newaxis, :, :]
+        dist_mat: NDArray[np.float64] = np.sqrt((diff * diff).sum(axis=-1))
+
+        best_arrangement = _best_assignment(dist_mat)
         ordered_prefixes: list[str] = [closest_prefixes[p_i] for p_i in best_arrangement]
-        identified_by_coordinate[frozen_coord] = ordered_prefixes, fit_result
+        identified.append((ordered_prefixes, current_vectors))
         identified_band_results.append(ordered_prefixes)
 
     return np.asarray(identified_band_results, dtype=np.object_)
 
 
-def _modelresult_to_array(
+SMALL_ASSIGNMENT_SIZE = 5
+
+
+@numba.njit(cache=True)
+def _permutation_assignment(dist_mat: NDArray[np.float64]) -> NDArray[np.int64]:
+    """Exhaustive minimum-trace assignment, enumerating permutations with Heap's algorithm."""
+    n = dist_mat.shape[0]
+    perm = np.arange(n)
+    best = perm.copy()
+    best_cost = 0.0
+    for i in range(n):
+        best_cost += dist_mat[i, perm[i]]
+    counters = np.zeros(n, dtype=np.int64)
+    i = 1
+    while i < n:
+        if counters[i] < i:
+            j = counters[i] if i % 2 else 0
+            perm[j], perm[i] = perm[i], perm[j]
+            cost = 0.0
+            for k in range(n):
+                cost += dist_mat[k, perm[k]]
+            if cost < best_cost:
+                best_cost = cost
+                best[:] = perm
+            counters[i] += 1
+            i = 1
+        else:
+            counters[i] = 0
+            i += 1
+    return best
+
+
+def _best_assignment(dist_mat: NDArray[np.float64]) -> NDArray[np.int64]:
+    """Column assigned to each row that minimizes the trace of the distance matrix.
+
+    Band fits rarely have more than a handful of components, where a compiled search over all
+    permutations is cheaper than dispatching to scipy. Larger problems fall back to the Hungarian
+    algorithm in `scipy.optimize.linear_sum_assignment`.
+
+    Args:
+        dist_mat (NDArray[np.float64]): Square matrix of distances between bands.
+
+    Returns: NDArray[np.int64]
+        best_arrangement
+    """
+    if len(dist_mat) <= SMALL_ASSIGNMENT_SIZE:
+        return _permutation_assignment(np.ascontiguousarray(dist_mat, dtype=np.float64))
+    _, best_arrangement = linear_sum_assignment(dist_mat)
+    return best_arrangement
+
+
+def _modelresult_to_vectors(
     model_fit: ModelResult,
-    prefix: str = "",
+    param_names: list[tuple[str, str, str, str]],
     weights: tuple[float, float, float] = (2, 0, 10),
 ) -> NDArray[np.float64]:
-    """Convert ModelResult to NDArray.
+    """Convert the bands of a ModelResult to weighted (width, amplitude, center) vectors.
+
+    The parameters of every band are read in a single pass, and the weighting by
+    `weights / (1 + stderr)` is then applied to all of the bands at once in a compiled kernel.
 
     Args:
-        model_fit (ModelResult): [TODO:description]
-        prefix (str): Prefix in ModelResult
+        model_fit (ModelResult): Fit result containing the bands.
+        param_names (list[tuple[str, str, str, str]]): Names of the (sigma, gamma, amplitude,
+            center) parameters of each band in ModelResult
         weights (tuple[float, float, float]): Weight for (sigma, amplitude, center)
 
+    Returns: NDArray[np.float64]
+        Array with shape (len(param_names), 3), a row for each band.
     """
-    parameter_names: set[str] = set(model_fit.params.keys())
-    if prefix + "sigma" in parameter_names:
-        param_width: Parameter = model_fit.params[prefix + "sigma"]
-    else:
-        param_width = lf.Parameter(name=prefix + "sigma", value=1)
-        param_width.stderr = 1
-        weights = (0.0, weights[1], weights[2])
-    if prefix + "gamma" in parameter_names:
-        param_width = model_fit.params[prefix + "gamma"]
-    if prefix + "amplitude" in parameter_names:
-        param_amplitude = model_fit.params[prefix + "amplitude"]
-    else:
-        param_amplitude = lf.Parameter(name=prefix + "amplitude", value=1)
-        param_amplitude.stderr = 1
-        weights = (weights[0], 0.0, weights[2])
-
-    stderr: NDArray[np.float64] = np.array(
-        [
-            param_width.stderr,
-            param_amplitude.stderr,
-            model_fit.params[prefix + "center"].stderr,
-        ],
-    )
-    return (
-        np.array(
-            [
-                param_width.value,
-                param_amplitude.value,
-                model_fit.params[prefix + "center"].value,
-            ],
-        )
-        * weights
-        / (1 + stderr)
+    params = model_fit.params
+    values: NDArray[np.float64] = np.ones((len(param_names), 3))
+    stderrs: NDArray[np.float64] = np.ones((len(param_names), 3))
+    band_weights: NDArray[np.float64] = np.tile(
+        np.asarray(weights, dtype=float),
+        (len(param_names), 1),
     )
+    for i, (sigma_name, gamma_name, amplitude_name, center_name) in enumerate(param_names):
+        if sigma_name not in params:
+            band_weights[i, 0] = 0.0
+        width: Parameter | None = params.get(gamma_name, params.get(sigma_name))
+        if width is not None:
+            values[i, 0], stderrs[i, 0] = width.value, width.stderr
+        if amplitude_name in params:
+            amplitude: Parameter = params[amplitude_name]
+            values[i, 1], stderrs[i, 1] = amplitude.value, amplitude.stderr
+        else:
+            band_weights[i, 1] = 0.0
+        center: Parameter = params[center_name]
+        values[i, 2], stderrs[i, 2] = center.value, center.stderr
+
+    return _weight_band_vectors(values, stderrs, band_weights)
+
+
+@numba.njit(cache=True)
+def _weight_band_vectors(
+    values: NDArray[np.float64],
+    stderrs: NDArray[np.float64],
+    band_weights: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Fused `values * band_weights / (1 + stderrs)`, without the temporaries of NumPy."""
+    weighted = np.empty_like(values)
+    for i in range(values.shape[0]):
+        for j in range(values.shape[1]):
+            weighted[i, j] = values[i, j] * band_weights[i, j] / (1 + stderrs[i, j])
+    return weighted
 
 
 @update_provenance("Fit bands from pattern")
@@ -357,6 +390,8 @@ def fit_patterned_bands(  # noqa: PLR0913
     background: bool | type[Band] = True,
     interactive: bool = True,
     dataset: bool = True,
+    parallelize: bool = False,
+    compute_norm_residual: bool = True,
 ) -> XrTypes:
     """Fits bands and determines dispersion in some region of a spectrum.
 
@@ -383,6 +418,10 @@ def fit_patterned_bands(  # noqa: PLR0913
         background (bool): [ToDo: description]
         interactive(bool): [ToDo: description]
         dataset(bool): if true, return as xr.Dataset.
+        parallelize (bool): Whether to fit the marginals on the process pool. The fitter, with
+            the data and the band classes, is sent to the workers serialized with dill.
+        compute_norm_residual (bool): if true, the dataset includes the residual normalized by the
+            data as "norm_residual".
 
     Returns: XrTypes
         Dataset or DataArray, as controlled by the parameter "dataset"
@@ -394,7 +433,93 @@ def fit_patterned_bands(  # noqa: PLR0913
 
     free_directions = [dim for dim in arr.dims if str(dim) != fit_direction]
 
+    template = arr.sum(fit_direction)
+    band_results = template.G.with_values(
+        np.empty(template.values.shape, dtype=object),
+        keep_attrs=True,
+    )
+
+    # best fits are gathered with the fit direction last, in the order of the free directions
+    fit_axis = arr.dims.index(fit_direction)
+    best_fit_values = np.zeros((*template.shape, len(arr.coords[fit_direction])))
+    is_fitted = np.zeros(template.shape, dtype=bool)
+
+    total_slices = np.prod([len(arr.coords[d]) for d in free_directions])
+    fitter = _PatternedBandFitter(
+        arr=arr,
+        band_set=band_set,
+        stray=stray,
+        background=background,
+        serialize=parallelize,
+    )
+    coord_dicts = arr.G.iter_coords(free_directions)
+    if parallelize:
+        # a chunk of marginals shares one copy of the fitter in the worker, and so its models
+        chunksize = max(1, int(total_slices) // (4 * (os.cpu_count() or 1)))
+        chunks = iter(lambda: list(itertools.islice(coord_dicts, chunksize)), [])
+        fit_results = itertools.chain.from_iterable(
+            hot_pool.pool.imap(
+                functools.partial(_fit_serialized_chunk, dill.dumps(fitter)),
+                chunks,
+            ),
+        )
+    else:
+        fit_results = map(fitter, coord_dicts)
+    for index, fitted in wrap_tqdm(
+        zip(np.ndindex(template.shape), fit_results, strict=True),
+        interactive=interactive,
+        desc="fitting",  # Prefix for the progressbar.
+        total=total_slices,  # The number of expected iterations. If unspecified,
+    ):
+        # populate models, sample code
+        fit_result = dill.loads(fitted) if parallelize else fitted  # noqa: S301
+        band_results.values[index] = fit_result
+        # rows with dropped (NaN) points cannot be placed back and keep a zero residual
+        if fit_result is not None and fit_result.best_fit.shape == best_fit_values.shape[-1:]:
+            best_fit_values[index] = fit_result.best_fit
+            is_fitted[index] = True
+
+    if not dataset:
+        band_results.attrs["original_data"] = arr
+        return band_results
+
+    residual_by_fit = np.where(
+        is_fitted[..., np.newaxis],
+        np.moveaxis(arr.values, fit_axis, -1) - best_fit_values,
+        0.0,
+    )
+    residual = arr.G.with_values(np.moveaxis(residual_by_fit, -1, fit_axis))
+
+    data_vars = {
+        "data": arr,
+        "residual": residual,
+        "results": band_results,
+    }
+    if compute_norm_residual:
+        data_vars["norm_residual"] = residual / arr
+    return xr.Dataset(data_vars=data_vars, coords=residual.coords)
+
+
+@dataclass
+class _PatternedBandFitter:
+    """Fits the bands of `fit_patterned_bands` to the marginal at a single coordinate.
+
+    The settings which do not change from marginal to marginal are closed over, so that the
+    fitter can be sent as is to the workers of the process pool. Fit results are serialized with
+    dill when requested, because `lmfit` instances do not pickle reliably.
+    """
+
+    arr: xr.DataArray
+    band_set: dict[Incomplete, Incomplete]
+    stray: float | None = None
+    background: bool | type[Band] = True
+    serialize: bool = False
+
+    _models: dict[Hashable, lf.Model] = field(default_factory=dict, init=False, repr=False)
+
     def resolve_partial_bands_from_description(  # noqa: PLR0913
+        self,
+        *,
         coord_dict: dict[str, Incomplete],
         marginal: xr.DataArray | None = None,
         name: str = "",
@@ -412,7 +537,7 @@ def fit_patterned_bands(  # noqa: PLR0913
         partial_band_locations = list(
             _interpolate_intersecting_fragments(
                 coord=coord_dict[coord_name],
-                coord_index=arr.dims.index(coord_name),
+                coord_index=self.arr.dims.index(coord_name),
                 points=points or [],
             ),
         )
@@ -423,86 +548,95 @@ def fit_patterned_bands(  # noqa: PLR0913
                 "params": _correct_params_with_stray_marginal(
                     params=params,
                     center=band_center,
-                    center_stray=params.get("stray", stray),
+                    center_stray=params.get("stray", self.stray),
                     marginal=marginal,
                 ),
             }
             for i, (_, band_center) in enumerate(partial_band_locations)
         ]
 
-    template = arr.sum(fit_direction)
-    band_results = template.G.with_values(
-        np.ndarray(shape=template.values.shape, dtype=object),
-        keep_attrs=True,
-    )
-
-    total_slices = np.prod([len(arr.coords[d]) for d in free_directions])
-    for coord_dict in wrap_tqdm(
-        arr.G.iter_coords(free_directions),
-        interactive=interactive,
-        desc="fitting",  # Prefix for the progressbar.
-        total=total_slices,  # The number of expected iterations. If unspecified,
-    ):
-        marginal = arr.sel(coord_dict)
+    def composite_model(self, partial_bands: list[BandDescription]) -> lf.Model:
+        """Builds the composite model of the partial bands, or reuses it for the same pattern.
+
+        Across marginals usually only the values of the parameter hints change, so the model is
+        cached by the bands, their names and the names of their hints. On reuse, the hints are
+        set again on the components, whose hint dicts the composite model shares.
+        """
+        key = tuple(
+            (
+                b["band"],
+                b["name"],
+                tuple(
+                    (coord, tuple(sorted(p)))
+                    for coord, p in b["params"].items()
+                    if coord != "stray"  # a number, and not a hint of the model
+                ),
+            )
+            for b in partial_bands
+        )
+        composite_model = self._models.get(key)
+        if composite_model is None:
+            composite_model = functools.reduce(
+                operator.add,
+                [_instantiate_band(b) for b in partial_bands],
+            )
+            self._models[key] = composite_model
+            return composite_model
+
+        for component, partial_band in zip(composite_model.components, partial_bands, strict=True):
+            for constraint_coord, params in partial_band["params"].items():
+                if constraint_coord == "stray":
+                    continue
+                component.set_param_hint(constraint_coord, **params)
+        return composite_model
+
+    def __call__(self, coord_dict: dict[Hashable, float]) -> ModelResult | bytes | None:
+        """Performs the fit of the marginal at the coordinates specified by `coord_dict`."""
+        marginal = self.arr.sel(coord_dict)
         partial_bands = [
-            resolve_partial_bands_from_description(
+            self.resolve_partial_bands_from_description(
                 coord_dict=coord_dict,
                 marginal=marginal,
                 **band_set_values,
             )
-            for band_set_values in band_set.values()
+            for band_set_values in self.band_set.values()
         ]
 
         partial_bands = [p for p in partial_bands if len(p)]
 
-        if background is not None and partial_bands:
-            partial_bands = [*partial_bands, [{"band": background, "name": "", "params": {}}]]
-
-        internal_models = [_instantiate_band(b) for bs in partial_bands for b in bs]
-
-        if not internal_models:
-            band_results.loc[coord_dict] = None
-            continue
-
-        composite_model = functools.reduce(operator.add, internal_models)
-        new_params = composite_model.make_params()
-        fit_result = composite_model.fit(
-            marginal.values,
-            new_params,
-            x=marginal.coords[next(iter(marginal.indexes))].values,
-        )
-
-        # populate models, sample code
-        band_results.loc[coord_dict] = fit_result
-
-    if not dataset:
-        band_results.attrs["original_data"] = arr
-        return band_results
-
-    residual = arr.G.with_values(np.zeros(arr.shape))
+        if self.background is not None and partial_bands:
+            partial_bands = [
+                *partial_bands,
+                [{"band": self.background, "name": "", "params": {}}],
+            ]
+
+        flat_partial_bands = [b for bs in partial_bands for b in bs]
+
+        fit_result = None
+        if flat_partial_bands:
+            composite_model = self.composite_model(flat_partial_bands)
+            new_params = composite_model.make_params()
+            fit_result = composite_model.fit(
+                marginal.values,
+                new_params,
+                x=marginal.coords[next(iter(marginal.indexes))].values,
+            )
 
-    for coords in band_results.G.iter_coords():
-        fit_item = band_results.sel(coords).item()
-        if fit_item is None:
-            continue
+        if self.serialize:
+            return dill.dumps(fit_result)
+        return fit_result
 
-        with contextlib.suppress(Exception):
-            residual.loc[coords] = fit_item.residual
-
-    return xr.Dataset(
-        data_vars={
-            "data": arr,
-            "residual": residual,
-            "results": band_results,
-            "norm_residual": residual / arr,
-        },
-        coords=residual.coords,
-    )
 
+def _fit_serialized_chunk(
+    serialized_fitter: bytes,
+    coord_dicts: list[dict[Hashable, float]],
+) -> list[ModelResult | bytes | None]:
+    """Fits a chunk of marginals in a worker, with a fitter serialized by dill.
 
-def _is_between(x: float, y0: float, y1: float) -> bool:
-    y0, y1 = np.min([y0, y1]), np.max([y0, y1])
-    return y0 <= x <= y1
+    dill, unlike pickle, also serializes the band classes defined in a notebook.
+    """
+    fitter = dill.loads(serialized_fitter)  # noqa: S301
+    return [fitter(coord_dict) for coord_dict in coord_dicts]
 
 
 def _instantiate_band(partial_band: dict[str, Any]) -> lf.Model:
@@ -551,7 +685,6 @@ def fit_bands(
     # Find subsequent peaks by fitting models to the residuals
     raw_bands = [band_description.get("band") for band_description in band_descriptions]
     initial_fits = None
-    all_fit_parameters = {}
 
     for band_description in band_descriptions:
         band_inst: Band = band_description.get("band")
@@ -572,19 +705,21 @@ def fit_bands(
             pass
 
     template = arr.sum(broadcast_direction)
-    band_results = template.G.with_values(np.zeros_like(template.values))
+    band_results = template.G.with_values(np.empty(template.values.shape, dtype=object))
+    # coordinates (row-wise) and parameters of every marginal fit so far, in order
+    fitted_coords: NDArray[np.float64] = np.empty((template.size, template.ndim))
+    all_fit_parameters: list[lf.Parameters] = []
     for marginal, coordinate in _iterate_marginals(arr, directions):
         # Use the closest parameters that have been successfully fit, or use the initial
         # parameters, this should be good enough because the order of the iterator will
         # be stable
         closest_model_params = initial_fits  # fix me
-        dist = np.inf
-        frozen_coordinate = tuple(coordinate[str(k)] for k in template.dims)
-        for c, v in all_fit_parameters.items():
-            delta = np.array(c) - frozen_coordinate
-            current_distance = delta.dot(delta)
-            if current_distance < dist and direction in {"mdc", "MDC"}:  # TODO: remove me
-                closest_model_params = v
+        frozen_coordinate = np.array([coordinate[str(k)] for k in template.dims], dtype=float)
+        if all_fit_parameters and direction in {"mdc", "MDC"}:  # TODO: remove me
+            delta = fitted_coords[: len(all_fit_parameters)] - frozen_coordinate
+            closest_model_params = all_fit_parameters[
+                int(np.einsum("ij,ij->i", delta, delta).argmin())
+            ]
 
         # TODO: mix in any params to the model params
 
@@ -603,7 +738,8 @@ def fit_bands(
         # insert fit into the results, insert the parameters into the cache so that we have
         # fitting parameters for the next sequence
         band_results.loc[coordinate] = fit_result
-        all_fit_parameters[frozen_coordinate] = fit_result.params
+        fitted_coords[len(all_fit_parameters)] = frozen_coordinate
+        all_fit_parameters.append(fit_result.params)
 
     # Unpack the band results
     unpacked_bands = None
@@ -626,28 +762,21 @@ def _interpolate_intersecting_fragments(
     """
     assert len(points[0]) == TWO_DIMENSION
 
-    for point_low, point_high in pairwise(points):
-        coord_other_index = 1 - coord_index
-
-        check_coord_low, check_coord_high = point_low[coord_index], point_high[coord_index]
-        if _is_between(coord, check_coord_low, check_coord_high):
-            # this is unnecessarily complicated
-            if check_coord_low < check_coord_high:
-                yield (
-                    coord,
-                    (coord - check_coord_low)
-                    / (check_coord_high - check_coord_low)
-                    * (point_high[coord_other_index] - point_low[coord_other_index])
-                    + point_low[coord_other_index],
-                )
-            else:
-                yield (
-                    coord,
-                    (coord - check_coord_high)
-                    / (check_coord_low - check_coord_high)
-                    * (point_low[coord_other_index] - point_high[coord_other_index])
-                    + point_high[coord_other_index],
-                )
+    pts = np.asarray(points, dtype=float)
+    coord_other_index = 1 - coord_index
+    low, high = pts[:-1], pts[1:]
+    check_coord_low, check_coord_high = low[:, coord_index], high[:, coord_index]
+    # the segments between consecutive points which straddle `coord`
+    is_between = (np.minimum(check_coord_low, check_coord_high) <= coord) & (
+        coord <= np.maximum(check_coord_low, check_coord_high)
+    )
+    # interpolating from either end of a segment gives the same line, so start from `low`
+    with np.errstate(invalid="ignore", divide="ignore"):
+        interpolated = (coord - check_coord_low) / (check_coord_high - check_coord_low) * (
+            high[:, coord_other_index] - low[:, coord_other_index]
+        ) + low[:, coord_other_index]
+    for other in interpolated[is_between]:
+        yield coord, other
 
 
 def _iterate_marginals(
@@ -659,10 +788,14 @@ def _iterate_marginals(
         if iterate_directions is not None
         else [str(dim) for dim in arr.dims if dim != "eV"]
     )
-    selectors = product(*[arr.coords[d] for d in iterate_directions])
-    for ss in selectors:
-        coords = dict(zip(iterate_directions, [float(s) for s in ss], strict=True))
-        yield arr.sel(coords), coords
+    # select positionally so that each marginal skips the label lookup of .sel
+    coord_values = [arr.coords[d].values for d in iterate_directions]
+    for indices in np.ndindex(*[len(values) for values in coord_values]):
+        coords = {
+            d: float(values[i])
+            for d, values, i in zip(iterate_directions, coord_values, indices, strict=True)
+        }
+        yield arr.isel(dict(zip(iterate_directions, indices, strict=True))), coords
 
 
 def _correct_params_with_stray_marginal(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, NamedTuple
 
 import numpy as np
@@ -19,6 +20,10 @@ class ParamType(NamedTuple):
     stderr: float
 
 
+_SAFE_PARAM = ParamType(value=np.nan, stderr=np.nan)
+
+
+@functools.cache
 def param_getter(param_name: str, *, safe: bool = True) -> Callable[..., float]:
     """Constructs a function to extract a parameter value by name.
 
@@ -32,14 +37,14 @@ def param_getter(param_name: str, *, safe: bool = True) -> Callable[..., float]:
           to have NaNs fail an analysis quickly.
 
     Returns:
-        A function which fetches the fitted value for this named parameter.
+        A function which fetches the fitted value for this named parameter. The function is
+        cached, so the same one is returned for the same arguments.
     """
     if safe:
-        safe_param = ParamType(value=np.nan, stderr=np.nan)
 
         def getter(x: lf.model.ModelResult) -> float:
             try:
-                return x.params.get(param_name, safe_param).value
+                return x.params.get(param_name, _SAFE_PARAM).value
             except IndexError:
                 return np.nan
 
@@ -48,6 +53,7 @@ def param_getter(param_name: str, *, safe: bool = True) -> Callable[..., float]:
     return lambda x: x.params[param_name].value
 
 
+@functools.cache
 def param_stderr_getter(param_name: str, *, safe: bool = True) -> Callable[..., float]:
     """Constructs a function to extract a parameter value by name.
 
@@ -61,14 +67,14 @@ def param_stderr_getter(param_name: str, *, safe: bool = True) -> Callable[...,
           to have NaNs fail an analysis quickly.
 
     Returns:
-        A function which fetches the standard error for this named parameter.
+        A function which fetches the standard error for this named parameter. The function is
+        cached, so the same one is returned for the same arguments.
     """
     if safe:
-        safe_param = ParamType(value=np.nan, stderr=np.nan)
 
         def getter(x: lf.model.ModelResult) -> float:
             try:
-                return x.params.get(param_name, safe_param).stderr
+                return x.params.get(param_name, _SAFE_PARAM).stderr
             except IndexError:
                 return np.nan
 
@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 import functools
-from typing import TYPE_CHECKING, Literal, NamedTuple
+import weakref
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar
 
+import numba
 import numpy as np
 import xarray as xr
+from scipy import ndimage
 
+from arpes.constants import TWO_DIMENSION
 from arpes.provenance import Provenance, provenance, update_provenance
 from arpes.utilities import normalize_to_spectrum
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
 
-    from numpy.typing import NDArray
+    from numpy.typing import DTypeLike, NDArray
 
 
 __all__ = (
+    "DerivativeCache",
     "curvature1d",
     "curvature2d",
     "d1_along_axis",
@@ -26,22 +31,124 @@ __all__ = (
 )
 
 DELTA = Literal[0, 1, -1]
+GRADIENT_KERNEL = Literal["neighbors", "sobel"]
+
+T = TypeVar("T")
 
 
 class D(NamedTuple):
-    x: xr.DataArray
-    y: xr.DataArray
+    x: NDArray[np.float64]
+    y: NDArray[np.float64]
 
 
 class D2(NamedTuple):
-    x: xr.DataArray
-    y: xr.DataArray
-    xy: xr.DataArray
+    x: NDArray[np.float64]
+    y: NDArray[np.float64]
+    xy: NDArray[np.float64]
+
+
+class DerivativeCache:
+    """Keeps smoothed data and its derivatives for reuse by the curvature functions.
+
+    Pass the same instance as ``cache`` to repeated calls on the same data, e.g., when scanning
+    alpha, so that the data is smoothed and differentiated only once::
+
+        cache = DerivativeCache()
+        curvatures = [curvature2d(arr, alpha=alpha, cache=cache) for alpha in alphas]
 
+    Entries are keyed by the identity of the input DataArray, of which no reference is kept: the
+    entries of an input are dropped when it is garbage collected. The cache can not notice the
+    values of an input being modified in place; call `clear` in that case.
+    """
 
-def _nothing_to_array(x: xr.DataArray) -> xr.DataArray:
-    """Dummy function for DataArray."""
-    return x
+    def __init__(self) -> None:
+        """Starts empty."""
+        self._entries: dict[int, dict[Hashable, Any]] = {}
+
+    def __len__(self) -> int:
+        """The number of inputs with cached results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drops all the cached results."""
+        self._entries.clear()
+
+    def _entry(self, arr: xr.DataArray) -> dict[Hashable, Any]:
+        if id(arr) not in self._entries:
+            self._entries[id(arr)] = {}
+            weakref.finalize(arr, _forget_array, weakref.ref(self), id(arr))
+        return self._entries[id(arr)]
+
+    def _get(self, arr: xr.DataArray, key: Hashable, compute: Callable[[], T]) -> T:
+        entry = self._entry(arr)
+        if key not in entry:
+            entry[key] = compute()
+        return entry[key]
+
+    def smoothed(
+        self,
+        arr: xr.DataArray,
+        smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None,
+    ) -> xr.DataArray:
+        """Applies smooth_fn to arr. If smooth_fn is None, arr itself is returned, uncached."""
+        if smooth_fn is None:
+            return arr
+        return self._get(arr, ("smoothed", smooth_fn), lambda: smooth_fn(arr))
+
+    def derivatives(
+        self,
+        arr: xr.DataArray,
+        dim: str,
+        smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None,
+        dtype: DTypeLike = np.float64,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """First and second derivatives along dim of the smoothed array.
+
+        Same as calling DataArray.differentiate twice, but without wrapping each derivative in a
+        DataArray. The returned arrays may be shared between calls and are therefore read-only.
+        """
+
+        def compute() -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+            smoothed = self.smoothed(arr, smooth_fn)
+            axis, coord = smoothed.get_axis_num(dim), smoothed.coords[dim].values
+            d1_values = np.gradient(smoothed.values.astype(dtype, copy=False), coord, axis=axis)
+            d2_values = np.gradient(d1_values, coord, axis=axis)
+            d1_values.flags.writeable = False
+            d2_values.flags.writeable = False
+            return d1_values, d2_values
+
+        return self._get(arr, ("derivatives", dim, smooth_fn, dtype), compute)
+
+    def steepest_descent(
+        self,
+        arr: xr.DataArray,
+        dim: str,
+        smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None,
+        dtype: DTypeLike = np.float64,
+    ) -> float:
+        """Absolute value of the minimum of the first derivative along dim."""
+        return self._get(
+            arr,
+            ("steepest_descent", dim, smooth_fn, dtype),
+            lambda: abs(float(np.nanmin(self.derivatives(arr, dim, smooth_fn, dtype)[0]))),
+        )
+
+
+class _CallCache(DerivativeCache):
+    """Shares the intermediate results within a single call, when no cache is given.
+
+    It is dropped with the call, so it does not need to watch its inputs.
+    """
+
+    def _entry(self, arr: xr.DataArray) -> dict[Hashable, Any]:
+        return self._entries.setdefault(id(arr), {})
+
+
+def _forget_array(cache_ref: weakref.ref[DerivativeCache], arr_id: int) -> None:
+    """Drops the entries of a garbage collected array, if the cache is still alive."""
+    cache = cache_ref()
+    if cache is not None:
+        cache._entries.pop(arr_id, None)  # noqa: SLF001
 
 
 def _vector_diff(
@@ -67,6 +174,15 @@ def _vector_diff(
     if n < 0:
         raise ValueError("Order must be non-negative but got " + repr(n))
 
+    nonzero_axes = [dim for dim, delta_val in enumerate(delta) if delta_val != 0]
+    if len(nonzero_axes) == 1 and abs(delta[nonzero_axes[0]]) == 1:
+        axis = nonzero_axes[0]
+        diff = np.diff(arr, n=n, axis=axis)
+        # np.diff takes arr[1:] - arr[:-1]; a negative step subtracts the other way around
+        if delta[axis] < 0 and n % 2 == 1:
+            np.negative(diff, out=diff)
+        return diff
+
     slice1: list[slice] | tuple[slice, ...] = [slice(None)] * arr.ndim
     slice2: list[slice] | tuple[slice, ...] = [slice(None)] * arr.ndim
     assert isinstance(slice1, list)
@@ -83,10 +199,10 @@ def _vector_diff(
     slice1, slice2 = tuple(slice1), tuple(slice2)
     assert isinstance(slice1, tuple)
     assert isinstance(slice2, tuple)
-    if n > 1:
-        return _vector_diff(arr[slice1] - arr[slice2], delta, n - 1)
+    for _ in range(n):
+        arr = arr[slice1] - arr[slice2]
 
-    return arr[slice1] - arr[slice2]
+    return arr
 
 
 @update_provenance("Minimum Gradient")
@@ -95,6 +211,8 @@ def minimum_gradient(
     *,
     smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None = None,
     delta: DELTA = 1,
+    dtype: DTypeLike = np.float64,
+    kernel: GRADIENT_KERNEL = "neighbors",
 ) -> xr.DataArray:
     """Implements the minimum gradient approach to defining the band in a diffuse spectrum.
 
@@ -109,16 +227,47 @@ def minimum_gradient(
                     return gaussian_filtter_arr(arr, {"eV": 0.05, "phi": np.pi/180})
 
         delta(DELTA): should not set. Use default 1
+        dtype(DTypeLike): Floating point type used for the gradient. np.float32 halves the memory
+            traffic, which is usually precise enough for visualization.
+        kernel(GRADIENT_KERNEL): "neighbors" (default) uses the differences toward the eight
+            neighbours. "sobel" uses the Sobel operator of scipy.ndimage instead, which is
+            smoother and also handles the edges, but is scaled differently.
 
     Returns:
         The gradient of the original intensity, which enhances the peak position.
     """
     arr = data if isinstance(data, xr.DataArray) else normalize_to_spectrum(data)
     assert isinstance(arr, xr.DataArray)
-    smooth_ = _nothing_to_array if smooth_fn is None else smooth_fn
-    arr = smooth_(arr)
+    if smooth_fn is not None:
+        arr = smooth_fn(arr)
     arr = arr.assign_attrs(data.attrs)
-    return arr / _gradient_modulus(arr, delta=delta)
+    return arr / _gradient_modulus(arr, delta=delta, dtype=dtype, kernel=kernel)
+
+
+@numba.njit(parallel=True, cache=True)
+def _gradient_modulus_2d(
+    values: NDArray[np.float64],
+    delta: int,
+    modulus: NDArray[np.float64],
+) -> None:
+    """Efficiently computes the modulus of the differences toward the eight neighbours.
+
+    The neighbours are visited in the same order as the stacked differences of the N-D path,
+    and ones which fall outside of the array do not contribute.
+    """
+    n_rows, n_cols = values.shape
+    row_offsets = np.array([delta, 0, -delta, 0, delta, delta, -delta, -delta])
+    col_offsets = np.array([0, delta, 0, -delta, delta, -delta, delta, -delta])
+    for i in numba.prange(n_rows):
+        for j in range(n_cols):
+            center = values[i, j]
+            total = 0.0
+            for k in range(8):
+                row, col = i + row_offsets[k], j + col_offsets[k]
+                if 0 <= row < n_rows and 0 <= col < n_cols:
+                    diff = values[row, col] - center
+                    total += diff * diff
+            modulus[i, j] = np.sqrt(total)
 
 
 @update_provenance("Gradient Modulus")
@@ -126,38 +275,59 @@ def _gradient_modulus(
     data: xr.DataArray,
     *,
     delta: DELTA = 1,
+    dtype: DTypeLike = np.float64,
+    kernel: GRADIENT_KERNEL = "neighbors",
 ) -> xr.DataArray:
     """Helper function for minimum gradient.
 
     Args:
         data(DataType): 2D data ARPES (or STM?)
         delta(int): Δ value, no need to change in most case.
+        dtype(DTypeLike): Floating point type of the computation and of the result.
+        kernel(GRADIENT_KERNEL): "neighbors" or "sobel". delta is not used for "sobel".
 
     Returns: xr.DataArray
     """
     spectrum = data if isinstance(data, xr.DataArray) else normalize_to_spectrum(data)
     assert isinstance(spectrum, xr.DataArray)
-    values: NDArray[np.float64] = spectrum.values
-    gradient_vector = np.zeros(shape=(8, *values.shape))
-
-    gradient_vector[0, :-delta, :] = _vector_diff(values, (delta, 0))
-    gradient_vector[1, :, :-delta] = _vector_diff(values, (0, delta))
-    gradient_vector[2, delta:, :] = _vector_diff(values, (-delta, 0))
-    gradient_vector[4, :-delta, :-delta] = _vector_diff(values, (delta, delta))
-    gradient_vector[3, :, delta:] = _vector_diff(values, (0, -delta))
-    gradient_vector[5, :-delta, delta:] = _vector_diff(values, (delta, -delta))
-    gradient_vector[6, delta:, :-delta] = _vector_diff(values, (-delta, delta))
-    gradient_vector[7, delta:, delta:] = _vector_diff(values, (-delta, -delta))
-
-    return spectrum.G.with_values(np.linalg.norm(gradient_vector, axis=0))
+    values: NDArray[np.float64] = spectrum.values.astype(dtype, copy=False)
+    if kernel == "sobel":
+        return spectrum.G.with_values(ndimage.generic_gradient_magnitude(values, ndimage.sobel))
+    if values.ndim == TWO_DIMENSION:
+        modulus = np.empty(values.shape, dtype=values.dtype)
+        _gradient_modulus_2d(np.ascontiguousarray(values), delta, modulus)
+        return spectrum.G.with_values(modulus)
+
+    # the squared differences toward the eight neighbours are accumulated into a single array,
+    # rather than stacked into an (8, ...) array which is then reduced
+    modulus = np.zeros(values.shape, dtype=values.dtype)
+    for region, direction in (
+        ((slice(None, -delta), slice(None)), (delta, 0)),
+        ((slice(None), slice(None, -delta)), (0, delta)),
+        ((slice(delta, None), slice(None)), (-delta, 0)),
+        ((slice(None), slice(delta, None)), (0, -delta)),
+        ((slice(None, -delta), slice(None, -delta)), (delta, delta)),
+        ((slice(None, -delta), slice(delta, None)), (delta, -delta)),
+        ((slice(delta, None), slice(None, -delta)), (-delta, delta)),
+        ((slice(delta, None), slice(delta, None)), (-delta, -delta)),
+    ):
+        diff = _vector_diff(values, direction)
+        np.multiply(diff, diff, out=diff)
+        np.add(modulus[region], diff, out=modulus[region])
+    np.sqrt(modulus, out=modulus)
+
+    return spectrum.G.with_values(modulus)
 
 
 @update_provenance("Maximum Curvature 1D")
-def curvature1d(
+def curvature1d(  # noqa: PLR0913
     arr: xr.DataArray,
     dim: str = "",
     alpha: float = 0.1,
     smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None = None,
+    *,
+    dtype: DTypeLike = np.float64,
+    cache: DerivativeCache | None = None,
 ) -> xr.DataArray:
     r"""Provide "1D-Maximum curvature analyais.
 
@@ -169,6 +339,10 @@ def curvature1d(
         smooth_fn (Callable | None): smoothing function. Define like as:
             def warpped_filter(arr: xr.DataArray):
                 return gaussian_filtter_arr(arr, {"eV": 0.05, "phi": np.pi/180}, repeat_n=5)
+        dtype (DTypeLike): Floating point type used for the derivatives. np.float32 halves the
+            memory traffic, at the cost of precision.
+        cache (DerivativeCache | None): Reuses the smoothing and the derivatives of earlier calls
+            on the same data given the same cache, e.g., when scanning alpha.
 
     Returns:
         The curvature of the intensity of the original data.
@@ -177,12 +351,12 @@ def curvature1d(
     assert alpha > 0
     if not dim:
         dim = str(arr.dims[0])
-    smooth_ = _nothing_to_array if smooth_fn is None else smooth_fn
-    arr = smooth_(arr)
-    d_arr = arr.differentiate(dim)
-    d2_arr = d_arr.differentiate(dim)
-    denominator = (alpha * abs(float(d_arr.min().values)) ** 2 + d_arr**2) ** 1.5
-    filterd_arr = arr.G.with_values((d2_arr / denominator).values)
+    cache = _CallCache() if cache is None else cache
+    d_values, d2_values = cache.derivatives(arr, dim, smooth_fn, dtype)
+    steepest_descent = cache.steepest_descent(arr, dim, smooth_fn, dtype)
+    arr = cache.smoothed(arr, smooth_fn)
+    denominator = (alpha * steepest_descent**2 + d_values**2) ** 1.5
+    filterd_arr = arr.G.with_values(d2_values / denominator)
 
     if "id" in arr.attrs:
         filterd_arr.attrs["id"] = arr.attrs["id"] + "_CV"
@@ -195,13 +369,57 @@ def curvature1d(
     return filterd_arr
 
 
+def _curvature2d_values(
+    df: D,
+    d2f: D2,
+    weight: float,
+    offset: float,
+) -> NDArray[np.float64]:
+    """Evaluates the 2D curvature from the derivatives, reusing two buffers for the terms.
+
+    The operations are the same, and in the same order, as in the expression
+
+        ((offset + weight * df.x * df.x) * d2f.y
+         - 2 * weight * df.x * df.y * d2f.xy
+         + weight * (offset + df.y * df.y) * d2f.x)
+        / (offset + weight * df.x**2 + df.y**2) ** 1.5
+
+    but without allocating a temporary array for every intermediate.
+    """
+    numerator = np.multiply(weight, df.x)
+    numerator *= df.x
+    numerator += offset
+    numerator *= d2f.y
+    term = np.multiply(2 * weight, df.x)
+    term *= df.y
+    term *= d2f.xy
+    numerator -= term
+    np.multiply(df.y, df.y, out=term)
+    term += offset
+    term *= weight
+    term *= d2f.x
+    numerator += term
+
+    denominator = term
+    np.square(df.x, out=denominator)
+    denominator *= weight
+    denominator += offset
+    denominator += np.square(df.y)
+    np.power(denominator, 1.5, out=denominator)
+    numerator /= denominator
+    return numerator
+
+
 @update_provenance("Maximum Curvature 2D")
-def curvature2d(
+def curvature2d(  # noqa: PLR0913
     arr: xr.DataArray,
     dims: tuple[str, str] = ("phi", "eV"),
     alpha: float = 0.1,
     weight2d: float = 1,
     smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None = None,
+    *,
+    dtype: DTypeLike = np.float64,
+    cache: DerivativeCache | None = None,
 ) -> xr.DataArray:
     r"""Provide "2D-Maximum curvature analysis".
 
@@ -218,6 +436,10 @@ def curvature2d(
         smooth_fn (Callable | None): smoothing function. Define like as:
             def warpped_filter(arr: xr.DataArray):
                 return gaussian_filtter_arr(arr, {"eV": 0.05, "phi": np.pi/180}, repeat_n=5)
+        dtype (DTypeLike): Floating point type used for the derivatives. np.float32 halves the
+            memory traffic, at the cost of precision.
+        cache (DerivativeCache | None): Reuses the smoothing and the derivatives of earlier calls
+            on the same data given the same cache, e.g., when scanning alpha.
 
     Returns:
         The curvature of the intensity of the original data.
@@ -230,28 +452,23 @@ def curvature2d(
     assert weight2d != 0
     dx, dy = tuple(float(arr.coords[str(d)][1] - arr.coords[str(d)][0]) for d in arr.dims[:2])
     weight = (dx / dy) ** 2
-    if smooth_fn is not None:
-        arr = smooth_fn(arr)
-    df = D(x=arr.differentiate(dims[0]), y=arr.differentiate(dims[1]))
+    cache = _CallCache() if cache is None else cache
+    (dfx, d2fx), (dfy, d2fy) = (cache.derivatives(arr, d, smooth_fn, dtype) for d in dims)
+    avg_x, avg_y = (cache.steepest_descent(arr, d, smooth_fn, dtype) for d in dims)
+    arr = cache.smoothed(arr, smooth_fn)
+    df = D(x=dfx, y=dfy)
     d2f: D2 = D2(
-        x=df.x.differentiate(dims[0]),
-        y=df.y.differentiate(dims[1]),
-        xy=df.x.differentiate(dims[1]),
+        x=d2fx,
+        y=d2fy,
+        xy=np.gradient(dfx, arr.coords[dims[1]].values, axis=arr.get_axis_num(dims[1])),
     )
     if weight2d > 0:
         weight *= weight2d
     else:
         weight /= abs(weight2d)
-    avg_x = abs(float(df.x.min().values))
-    avg_y = abs(float(df.y.min().values))
     avg = max(avg_x**2, weight * avg_y**2)
-    numerator = (
-        (alpha * avg + weight * df.x * df.x) * d2f.y
-        - 2 * weight * df.x * df.y * d2f.xy
-        + weight * (alpha * avg + df.y * df.y) * d2f.x
-    )
-    denominator = (alpha * avg + weight * df.x**2 + df.y**2) ** 1.5
-    curv = arr.G.with_values((numerator / denominator).values)
+    curv_values = _curvature2d_values(df=df, d2f=d2f, weight=weight, offset=alpha * avg)
+    curv = arr.G.with_values(curv_values)
 
     if "id" in curv.attrs:
         del curv.attrs["id"]
@@ -274,6 +491,7 @@ def dn_along_axis(
     smooth_fn: Callable[[xr.DataArray], xr.DataArray] | None = None,
     *,
     order: int = 2,
+    cache: DerivativeCache | None = None,
 ) -> xr.DataArray:
     """Like curvature, performs a second derivative.
 
@@ -295,6 +513,8 @@ def dn_along_axis(
                 return gaussian_filtter_arr(arr, {"eV": 0.05, "phi": np.pi/180}, repeat_n=5)
 
         order: Specifies how many derivatives to take
+        cache (DerivativeCache | None): Reuses the smoothing and the first two derivatives of
+            earlier calls on the same data given the same cache.
 
     Returns:
         The nth derivative data.
@@ -302,10 +522,14 @@ def dn_along_axis(
     assert isinstance(arr, xr.DataArray)
     if not dim:
         dim = str(arr.dims[0])
-    smooth_ = _nothing_to_array if smooth_fn is None else smooth_fn
-    dn_arr = smooth_(arr)
-    for _ in range(order):
-        dn_arr = dn_arr.differentiate(dim)
+    if 1 <= order <= 2:  # noqa: PLR2004
+        cache = _CallCache() if cache is None else cache
+        dn_values = cache.derivatives(arr, dim, smooth_fn, np.float64)[order - 1]
+        dn_arr = cache.smoothed(arr, smooth_fn).G.with_values(dn_values.copy(), keep_attrs=False)
+    else:
+        dn_arr = arr if smooth_fn is None else smooth_fn(arr)
+        for _ in range(order):
+            dn_arr = dn_arr.differentiate(dim)
     dn_arr = dn_arr.assign_attrs(arr.attrs)
 
     if "id" in dn_arr.attrs:
@@ -41,6 +41,8 @@ logger.propagate = False
 
 A = TypeVar("A", NDArray[np.float64], float)
 
+FS_PER_UM = 3.335640951981521  # delay time (fs) per mirror movement (μm), i.e. 1 / c
+
 
 def build_crosscorrelation(
     datalist: Sequence[xr.DataArray],
@@ -93,7 +95,7 @@ def delaytime_fs(mirror_movement_um: A) -> A:
         delay time in fs.
 
     """
-    return 3.335640951981521 * mirror_movement_um
+    return FS_PER_UM * mirror_movement_um
 
 
 def position_to_delaytime(position_mm: A, delayline_offset_mm: float) -> A:
@@ -110,7 +112,9 @@ def position_to_delaytime(position_mm: A, delayline_offset_mm: float) -> A:
 
 
     """
-    return delaytime_fs(2 * (position_mm - delayline_offset_mm) * 1000)
+    # The light path is twice the mirror displacement. The constant factors are folded into one,
+    # so that array inputs are traversed twice rather than four times.
+    return (position_mm - delayline_offset_mm) * (2 * 1000 * FS_PER_UM)
 
 
 @update_provenance("Normalized subtraction map")
@@ -143,8 +147,7 @@ def normalized_relative_change(
     subtracted = relative_change(spectrum, t0, buffer, normalize_delay=False)
     assert isinstance(subtracted, xr.DataArray)
     normalized: xr.DataArray = subtracted / spectrum
-    normalized.values[np.isinf(normalized.values)] = 0
-    normalized.values[np.isnan(normalized.values)] = 0
+    np.nan_to_num(normalized.values, copy=False, nan=0, posinf=0, neginf=0)
     return normalized
 
 
@@ -204,10 +207,11 @@ def find_t_for_max_intensity(data: xr.DataArray, e_bound: float = 0.02) -> float
     assert "delay" in data.dims
     assert "eV" in data.dims
 
-    sum_dims = set(data.dims)
-    sum_dims.remove("delay")
-    sum_dims.remove("eV")
-
-    summed = data.sum(list(sum_dims)).sel(eV=slice(e_bound, None)).mean("eV")
-    coord_max = np.argmax(summed)
-    return summed.coords["delay"].values[coord_max]
+    # Same as data.sum(...).sel(eV=slice(e_bound, None)).mean("eV"), but reduced at once on the
+    # NumPy array, after restricting the energy range.
+    energy_range = data.indexes["eV"].slice_indexer(e_bound, None)
+    energy_axis, delay_axis = data.get_axis_num("eV"), data.get_axis_num("delay")
+    values = data.values[(slice(None),) * energy_axis + (energy_range,)]
+    sum_axes = tuple(axis for axis in range(data.ndim) if axis not in {energy_axis, delay_axis})
+    summed = np.nanmean(np.nansum(values, axis=sum_axes, keepdims=True), axis=energy_axis)
+    return float(data.coords["delay"].values[np.nanargmax(summed.ravel())])
@@ -14,26 +14,30 @@ must be considered.
 from __future__ import annotations
 
 import contextlib
-import copy
 import functools
-import random
+import itertools
+import os
 from dataclasses import dataclass
 from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar
 
+import dill
+import numba
 import numpy as np
+import pandas as pd
 import scipy.stats
 import xarray as xr
-from tqdm.notebook import tqdm
+from tqdm.auto import tqdm
 
 from .analysis.sarpes import to_intensity_polarization
+from .fits.hot_pool import hot_pool
 from .provenance import update_provenance
 from .utilities import lift_dataarray_to_generic
 from .utilities.normalize import normalize_to_spectrum
 from .utilities.region import normalize_region
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Hashable, Iterable, Iterator
 
     import lmfit as lf
     from _typeshed import Incomplete
@@ -63,6 +67,11 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.propagate = False
 
+# shared by the resampling functions, so that a generator is not seeded from the OS for every call
+_RNG = np.random.default_rng()
+
+POISSON_BACKEND = Literal["numpy", "numba"]
+
 
 @update_provenance("Estimate prior")
 def estimate_prior_adjustment(
@@ -104,19 +113,24 @@ def estimate_prior_adjustment(
 
 @update_provenance("Resample cycle dimension")
 @lift_dataarray_to_generic
-def resample_cycle(data: xr.DataArray) -> xr.DataArray:
+def resample_cycle(
+    data: xr.DataArray,
+    rng: np.random.Generator | None = None,
+) -> xr.DataArray:
     """Perform a non-parametric bootstrap.
 
     Cycle coordinate for statistically independent observations is used.
 
     Args:
         data: The input data.
+        rng: The random number generator to draw the cycles with. The module's one if None.
 
     Returns:
         Resampled data with selections from the cycle axis.
     """
     n_cycles = len(data.cycle)
-    which = [random.randint(0, n_cycles - 1) for _ in range(n_cycles)]  # noqa: S311
+    rng = _RNG if rng is None else rng
+    which = rng.integers(0, n_cycles, size=n_cycles)
 
     resampled = data.isel(cycle=which).sum("cycle", keep_attrs=True)
 
@@ -126,17 +140,53 @@ def resample_cycle(data: xr.DataArray) -> xr.DataArray:
     return resampled
 
 
+def _draw_cycle_counts(n_cycles: int, n: int, rng: np.random.Generator) -> NDArray[np.int_]:
+    """How many times each of n_cycles cycles is drawn with replacement, for n iterations."""
+    return rng.multinomial(n_cycles, np.full(n_cycles, 1 / n_cycles), size=n)
+
+
+@lift_dataarray_to_generic
+def _resample_cycle_counts(data: xr.DataArray, counts: NDArray[np.int_]) -> xr.DataArray:
+    """Resamples the cycle axis for all the bootstrap iterations at once.
+
+    Args:
+        data: The input data.
+        counts: (n_bootstrap, n_cycles) array of how many times each cycle is drawn in each
+            iteration.
+
+    Returns:
+        Resampled data with a leading "bootstrap" dimension in place of the cycle axis. It is
+        the same as stacking resample_cycle over the iterations, but the sums over the drawn
+        cycles are done as a single contraction with counts.
+    """
+    values = data.values
+    if np.issubdtype(values.dtype, np.floating):
+        values = np.where(np.isnan(values), 0, values)  # as sum("cycle") skips NaN
+    summed = np.tensordot(counts, values, axes=(1, data.get_axis_num("cycle")))
+    template = data.isel(cycle=0, drop=True)
+    resampled = xr.DataArray(
+        summed,
+        coords=template.coords,
+        dims=("bootstrap", *template.dims),
+        attrs=template.attrs.copy(),
+    )
+    resampled.attrs.pop("id", None)
+    return resampled
+
+
 @update_provenance("Resample with prior adjustment")
 @lift_dataarray_to_generic
 def resample(
     data: xr.DataArray,
     prior_adjustment: float = 1,
+    rng: np.random.Generator | None = None,
 ) -> xr.DataArray:
-    rg = np.random.default_rng()
+    rng = _RNG if rng is None else rng
+    lam = data.values if prior_adjustment == 1 else data.values * prior_adjustment
     resampled = xr.DataArray(
-        rg.poisson(
-            lam=data.values * prior_adjustment,
-            size=data.values.shape,
+        rng.poisson(
+            lam=lam,
+            size=lam.shape,
         ),
         coords=data.coords,
         dims=data.dims,
@@ -151,22 +201,32 @@ def resample(
 
 @update_provenance("Resample electron-counted data")
 @lift_dataarray_to_generic
-def resample_true_counts(data: xr.DataArray) -> xr.DataArray:
+def resample_true_counts(
+    data: xr.DataArray,
+    rng: np.random.Generator | None = None,
+    backend: POISSON_BACKEND = "numpy",
+) -> xr.DataArray:
     """Resamples histogrammed data where each count represents an actual electron.
 
     Args:
         data: Input data representing actual electron counts from a time of flight
               system or delay line.
+        rng: The random number generator to draw with. The module's one if None.
+        backend: "numpy" draws with `rng`, "numba" draws in parallel over the channels with
+            numba's per-thread generators (`rng` is then not used). The latter pays off for
+            large ToF cubes.
 
     Returns:
         Poisson resampled data.
     """
-    rg = np.random.default_rng()
+    if backend == "numba":
+        counts = np.empty(data.shape, dtype=np.int64)
+        _poisson_numba(np.ascontiguousarray(data.values, dtype=np.float64).ravel(), counts.ravel())
+    else:
+        rng = _RNG if rng is None else rng
+        counts = rng.poisson(lam=data.values, size=data.values.shape)
     resampled = xr.DataArray(
-        rg.poisson(
-            lam=data.values,
-            size=data.values.shape,
-        ),
+        counts,
         coords=data.coords,
         dims=data.dims,
         attrs=data.attrs,
@@ -184,6 +244,8 @@ def bootstrap_counts(
     data: xr.DataArray,
     n_samples: int = 1000,
     name: str | None = None,
+    chunk_size: int = 64,
+    backend: POISSON_BACKEND = "numpy",
 ) -> xr.Dataset:
     """Performs a parametric bootstrap assuming recorded data are electron counts.
 
@@ -193,12 +255,16 @@ def bootstrap_counts(
     This function also introspects the data passed to determine whether there is a
     spin degree of freedom, and will bootstrap appropriately.
 
-    Currently we build all the samples at once instead of using a rolling algorithm.
+    The samples are drawn in chunks of `chunk_size` and reduced with a streaming algorithm, so
+    that the memory usage does not grow with `n_samples`.
 
     Arguments:
         data: The input spectrum.
         n_samples: The number of samples to draw.
         name: The name of the subarray which represents counts to resample. E.g. "up_spectrum"
+        chunk_size: The number of samples drawn at once.
+        backend: "numpy" or "numba". With "numba", each channel draws and reduces its own
+            samples in parallel, and `chunk_size` is not used.
 
     Returns:
         A `xr.Dataset` which has the mean and standard error for the resampled named array.
@@ -206,17 +272,13 @@ def bootstrap_counts(
     assert data.name is not None or name is not None
     name = str(data.name) if data.name is not None else name
     assert isinstance(name, str)
-    desc_fragment = f" {name}"
-
-    resampled_sets = [
-        resample_true_counts(data)
-        for _ in tqdm(range(n_samples), desc=f"Resampling{desc_fragment}...")
-    ]
-
-    resampled_arr = np.stack([s.values for s in resampled_sets], axis=0)
-    std = np.std(resampled_arr, axis=0)
+    if backend == "numba":
+        lam = np.ascontiguousarray(data.values, dtype=np.float64)
+        mean, std = np.empty(lam.shape), np.empty(lam.shape)
+        _poisson_mean_std_numba(lam.ravel(), n_samples, mean.ravel(), std.ravel())
+    else:
+        mean, std = _poisson_mean_std(data.values, n_samples=n_samples, chunk_size=chunk_size)
     std = xr.DataArray(std, data.coords, tuple(data.dims))
-    mean = np.mean(resampled_arr, axis=0)
     mean = xr.DataArray(mean, data.coords, tuple(data.dims))
 
     data_vars = {}
@@ -226,6 +288,61 @@ def bootstrap_counts(
     return xr.Dataset(data_vars=data_vars, coords=data.coords, attrs=data.attrs.copy())
 
 
+def _poisson_mean_std(
+    lam: NDArray[np.float64],
+    n_samples: int,
+    chunk_size: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Mean and standard deviation (ddof=0) of n_samples Poisson draws with rate lam.
+
+    The draws are made chunk by chunk, and the statistics of each chunk are merged into the
+    running ones with the pairwise formula of Chan et al., instead of stacking all the samples.
+    """
+    mean = np.zeros(lam.shape)
+    m2 = np.zeros(lam.shape)
+    count = 0
+    for start in range(0, n_samples, chunk_size):
+        chunk = _RNG.poisson(lam=lam, size=(min(chunk_size, n_samples - start), *lam.shape))
+        n_chunk = chunk.shape[0]
+        chunk_mean = chunk.mean(axis=0)
+        delta = chunk_mean - mean
+        total = count + n_chunk
+        mean += delta * (n_chunk / total)
+        # the chunk variance reuses chunk_mean instead of recomputing it, as chunk.var would
+        deviations = chunk - chunk_mean
+        np.square(deviations, out=deviations)
+        m2 += deviations.sum(axis=0) + delta**2 * (count * n_chunk / total)
+        count = total
+    return mean, np.sqrt(m2 / count)
+
+
+@numba.njit(parallel=True, cache=True)
+def _poisson_numba(lam: NDArray[np.float64], out: NDArray[np.int64]) -> None:
+    """Fills the flat `out` with one Poisson draw per rate in the flat `lam`."""
+    for i in numba.prange(len(lam)):
+        out[i] = np.random.poisson(lam[i])  # noqa: NPY002  numba has no Generator
+
+
+@numba.njit(parallel=True, cache=True)
+def _poisson_mean_std_numba(
+    lam: NDArray[np.float64],
+    n_samples: int,
+    mean: NDArray[np.float64],
+    std: NDArray[np.float64],
+) -> None:
+    """Same as `_poisson_mean_std` for flat arrays, drawing and reducing channel by channel."""
+    for i in numba.prange(len(lam)):
+        running_mean = 0.0
+        m2 = 0.0
+        for k in range(n_samples):
+            draw = np.random.poisson(lam[i])  # noqa: NPY002  numba has no Generator
+            delta = draw - running_mean
+            running_mean += delta / (k + 1)
+            m2 += delta * (draw - running_mean)
+        mean[i] = running_mean
+        std[i] = np.sqrt(m2 / n_samples)
+
+
 class Distribution:
     DEFAULT_N_SAMPLES = 1000
 
@@ -245,13 +362,9 @@ class Normal(Distribution):
     def draw_samples(
         self,
         n_samples: int = Distribution.DEFAULT_N_SAMPLES,
-    ) -> NDArray[np.int_]:
+    ) -> NDArray[np.float64]:
         """Draws samples from this distribution."""
-        return scipy.stats.norm.rvs(
-            self.center,
-            scale=self.stderr,
-            size=n_samples,
-        )
+        return _RNG.normal(self.center, scale=self.stderr, size=n_samples)
 
     @classmethod
     def from_param(cls: type, model_param: lf.Model.Parameter) -> Incomplete:
@@ -281,21 +394,19 @@ def propagate_errors(f: Callable[P, R]) -> Callable[P, R]:
 
     @functools.wraps(f)
     def operates_on_distributions(*args: P.args, **kwargs: P.kwargs) -> R:
-        exclude = {idx for idx, arg in enumerate(args) if not isinstance(arg, Normal)}.union(
-            {k for k, arg in kwargs.items() if not isinstance(arg, Normal)},
-        )
-
-        if len(exclude) == len(args) + len(kwargs):
+        if not any(isinstance(arg, Normal) for arg in (*args, *kwargs.values())):
             # If no bootstrapping is needed, call the function directly.
             return f(*args, **kwargs)
 
-        vec_f = np.vectorize(f, excluded=exclude)
+        exclude = {idx for idx, arg in enumerate(args) if not isinstance(arg, Normal)}.union(
+            {k for k, arg in kwargs.items() if not isinstance(arg, Normal)},
+        )
 
         sampled_args = [arg.draw_samples() if isinstance(arg, Normal) else arg for arg in args]
         sampled_kwargs = {
             k: v.draw_samples() if isinstance(v, Normal) else v for k, v in kwargs.items()
         }
-        res = vec_f(*sampled_args, **sampled_kwargs)
+        res = _call_on_samples(f, exclude, *sampled_args, **sampled_kwargs)
 
         with contextlib.suppress(Exception):
             logger.info(scipy.stats.describe(res))
@@ -305,6 +416,26 @@ def propagate_errors(f: Callable[P, R]) -> Callable[P, R]:
     return operates_on_distributions
 
 
+def _call_on_samples(
+    f: Callable[..., Any],
+    exclude: set[int | str],
+    *args: Incomplete,
+    **kwargs: Incomplete,
+) -> NDArray[np.float64]:
+    """Evaluates f over the drawn samples.
+
+    f is first called once on the whole arrays of samples, which works for the typical
+    arithmetic on NumPy types. If this fails, or does not give one value per sample, f is
+    called sample by sample through np.vectorize instead.
+    """
+    n_samples = Distribution.DEFAULT_N_SAMPLES
+    with contextlib.suppress(TypeError, ValueError):
+        res = np.asarray(f(*args, **kwargs))
+        if res.shape == (n_samples,):
+            return res
+    return np.vectorize(f, excluded=exclude)(*args, **kwargs)
+
+
 @update_provenance("Bootstrap spin detector polarization and intensity")
 def bootstrap_intensity_polarization(data: xr.Dataset, n: int = 100) -> xr.Dataset:
     """Builds an estimate of the intensity and polarization from spin-data.
@@ -340,19 +471,23 @@ def bootstrap(
         See `resample` and `resample_cycle`. Defaults to None.
 
     Returns:
-        A function which vectorizes the output of the input function `fn` over samples.
+        A function which vectorizes the output of the input function `fn` over samples. Besides
+        the arguments of `fn`, it takes the number of samples `n`, `prior_adjustment`, the
+        random number generator `rng` to resample with (the module's one if None), and
+        `parallelize`, which runs the calls of `fn` on a process pool when `fn` is expensive.
     """
     skip = set(skip) if skip else set()
 
-    if resample_method is None:
-        resample_fn = resample
-    elif resample_method == "cycle":
-        resample_fn = resample_cycle
+    if resample_method not in {None, "cycle"}:
+        msg = f"Unknown resample_method: {resample_method}"
+        raise ValueError(msg)
 
     def bootstrapped(
         *args: Incomplete,
         n: int = 20,
         prior_adjustment: int = 1,
+        parallelize: bool = False,
+        rng: np.random.Generator | None = None,
         **kwargs: Incomplete,
     ) -> Incomplete:
         # examine args to determine which to resample
@@ -362,7 +497,6 @@ def bootstrap(
             if isinstance(arg, xr.DataArray | xr.Dataset) and i not in skip
         ]
 
-        runs = []
         msg = "Resampling args: "
         msg += f"{','.join([_get_label_from_args(args, i) for i in resample_indices])}"
         logger.info(msg)
@@ -378,28 +512,93 @@ def bootstrap(
             "Fair warning 2: Ensure that the data to resample is in a DataArray and not a Dataset",
         )
 
-        for _ in tqdm(range(n), desc="Resampling..."):
-            new_args = list(args)
-            new_kwargs = copy.copy(kwargs)
-            for i in resample_indices:
-                new_args[i] = resample_fn(args[i], prior_adjustment=prior_adjustment)
-            for k in resample_kwargs:
-                new_kwargs[k] = resample_fn(kwargs[k], prior_adjustment=prior_adjustment)
-
-            run = fn(*new_args, **new_kwargs)
-            runs.append(run)
-
+        rng = _RNG if rng is None else rng
+        to_resample = {i: args[i] for i in resample_indices} | {
+            k: kwargs[k] for k in resample_kwargs
+        }
+        if resample_method == "cycle":
+            # the cycles taken in every iteration are drawn up front, so that all the iterations
+            # are resampled in one go
+            cycle_resampled = {
+                key: _resample_cycle_counts(arg, _draw_cycle_counts(len(arg.cycle), n, rng))
+                for key, arg in to_resample.items()
+            }
+
+        def draw_samples() -> Iterator[dict[Hashable, DataType]]:
+            # samples are always drawn here, so that they do not depend on the worker processes
+            for j in range(n):
+                if resample_method == "cycle":
+                    yield {key: arr.isel(bootstrap=j) for key, arr in cycle_resampled.items()}
+                else:
+                    yield {
+                        key: resample(arg, prior_adjustment=prior_adjustment, rng=rng)
+                        for key, arg in to_resample.items()
+                    }
+
+        runner = _BootstrapRunner(fn=fn, args=args, kwargs=kwargs)
+        if parallelize:
+            # the runner carries all the data, so it is sent once per chunk of samples
+            chunksize = max(1, n // (4 * (hot_pool.n_workers or os.cpu_count() or 1)))
+            samples = draw_samples()
+            chunks = iter(lambda: list(itertools.islice(samples, chunksize)), [])
+            serialized_runs = hot_pool.pool.imap(
+                functools.partial(_call_serialized_chunk, dill.dumps(runner)),
+                chunks,
+            )
+            runs_iter = itertools.chain.from_iterable(
+                dill.loads(chunk_runs)  # noqa: S301
+                for chunk_runs in serialized_runs
+            )
+        else:
+            runs_iter = map(runner, draw_samples())
+        runs = list(tqdm(runs_iter, total=n, desc="Resampling..."))
+
+        bootstrap_index = [
+            i for i, run in enumerate(runs) if isinstance(run, xr.DataArray | xr.Dataset)
+        ]
         return xr.concat(
-            [
-                run.assign_coords(bootstrap=i)
-                for i, run in enumerate(runs)
-                if isinstance(run, xr.DataArray | xr.Dataset)
-            ],
+            [runs[i] for i in bootstrap_index],
+            dim=pd.Index(bootstrap_index, name="bootstrap"),
         )
 
     return functools.wraps(fn)(bootstrapped)
 
 
+@dataclass
+class _BootstrapRunner:
+    """Calls the bootstrapped function with one set of resampled arguments.
+
+    The arguments are copied once, and the resampled ones are overwritten in place for every
+    call, since each call replaces the same entries.
+    """
+
+    fn: Callable[..., DataType]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+    def __post_init__(self) -> None:
+        self._new_args = list(self.args)
+        self._new_kwargs = dict(self.kwargs)
+
+    def __call__(self, samples: dict[Hashable, DataType]) -> DataType:
+        for key, sample in samples.items():
+            if isinstance(key, int):
+                self._new_args[key] = sample
+            else:
+                self._new_kwargs[key] = sample
+        return self.fn(*self._new_args, **self._new_kwargs)
+
+
+def _call_serialized_chunk(serialized_fn: bytes, chunk: list[Any]) -> bytes:
+    """Runs a dill-serialized callable over a chunk of arguments in a pool worker.
+
+    The bootstrapped function is frequently a lambda or a closure, which can not be pickled, so
+    the callable and its results are serialized with dill.
+    """
+    fn = dill.loads(serialized_fn)  # noqa: S301
+    return dill.dumps([fn(arg) for arg in chunk])
+
+
 def _get_label_from_args(args: tuple[Any, ...], i: int) -> str:
     if isinstance(args[i], xr.Dataset):
         return "xr.Dataset: [{}]".format(", ".join(args[i].data_vars.keys()))
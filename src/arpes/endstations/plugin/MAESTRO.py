@@ -52,15 +52,9 @@ class MAESTROARPESEndstationBase(
         """
         scan = super().load(scan_desc, **kwargs)
 
-        coord_names = scan.coords.keys()
-        will_rename = {}
-        for coord_name in coord_names:
-            if coord_name in self.RENAME_KEYS:
-                will_rename[coord_name] = self.RENAME_KEYS.get(coord_name)
-
-        for v in will_rename.values():
-            if v in scan.coords:
-                del scan.coords[v]
+        will_rename = {k: self.RENAME_KEYS[k] for k in scan.coords if k in self.RENAME_KEYS}
+        for v in scan.coords.keys() & set(will_rename.values()):
+            del scan.coords[v]
 
         renamed = scan.rename(will_rename)
 
@@ -187,6 +181,15 @@ class MAESTRONanoARPESEndstation(MAESTROARPESEndstationBase):
         "physical_long_z",
     }
 
+    MICRON_COORDS: ClassVar[tuple[str, ...]] = (
+        "short_x",
+        "short_y",
+        "short_z",
+        "physical_long_x",
+        "physical_long_y",
+        "physical_long_z",
+    )
+
     ANALYZER_INFORMATION: ClassVar[dict[str, str | float]] = {
         "analyzer": "DA-30",
         "analyzer_name": "Scienta DA-30",
@@ -304,21 +307,26 @@ class MAESTRONanoARPESEndstation(MAESTROARPESEndstationBase):
         Returns:
             The updated data.
         """
+
+        def lookup(name: str):
+            if name in data.coords:
+                try:
+                    return data.coords[name].item()
+                except (AttributeError, ValueError):
+                    return data.coords[name].values
+            return np.nan
+
+        # the three directions are independent, so the renames and the new coordinates are
+        # collected first and applied to the data at once
+        physical_coords: dict[str, xr.DataArray] = {}
+        renames: dict[str, str] = {}
+        new_coords: dict[str, Incomplete] = {}
         for d_name in ["x", "y", "z"]:
             short, long = f"short_{d_name}", f"long_{d_name}"
             phys = f"physical_long_{d_name}"
-
-            def lookup(name: str):
-                if name in data.coords:
-                    try:
-                        return data.coords[name].item()
-                    except (AttributeError, ValueError):
-                        return data.coords[name].values
-                return np.nan
-
             c_short, c_long = lookup(short), lookup(long)
 
-            data.coords[phys] = -data.coords[phys]
+            physical_coords[phys] = -data.coords[phys]
 
             scan_coord_name = None
             if isinstance(c_short, np.ndarray):
@@ -326,18 +334,12 @@ class MAESTRONanoARPESEndstation(MAESTROARPESEndstationBase):
             elif isinstance(c_long, np.ndarray):
                 scan_coord_name = long
 
+            new_coords[d_name] = -c_short - c_long
             if scan_coord_name:
-                data = data.rename({scan_coord_name: d_name})
-                data = data.assign_coords(
-                    **{
-                        d_name: -c_short - c_long,
-                        scan_coord_name: -c_short if scan_coord_name == short else -c_long,
-                    },
-                )
-            else:
-                data = data.assign_coords(**{d_name: -c_short - c_long})
+                renames[scan_coord_name] = d_name
+                new_coords[scan_coord_name] = -c_short if scan_coord_name == short else -c_long
 
-        return data
+        return data.assign_coords(physical_coords).rename(renames).assign_coords(new_coords)
 
     @staticmethod
     def unwind_serptentine(data: xr.Dataset) -> xr.Dataset:
@@ -356,12 +358,13 @@ class MAESTRONanoARPESEndstation(MAESTROARPESEndstationBase):
         spectra = [dv for dv in data.data_vars.values() if "eV" in dv.dims]
         for spectrum in spectra:
             # serpentine axis always seems to be the first one, thankfully
-            old_values = spectrum.values.copy()
-
-            mask = np.mod(np.array(range(len(spectrum.coords[spectrum.dims[0]]))), 2) == 1
-            old_values[mask] = np.roll(old_values[mask, ::-1], 2, axis=1)
+            values = spectrum.values
+            if not values.flags.writeable:
+                values = values.copy()
+                spectrum.values = values
 
-            spectrum.values = old_values
+            # every other line was scanned backwards, the odd ones are reversed in place
+            values[1::2] = np.roll(values[1::2, ::-1], 2, axis=1)
 
         return data
 
@@ -390,41 +393,34 @@ class MAESTRONanoARPESEndstation(MAESTROARPESEndstationBase):
         data = data.rename({k: v for k, v in self.RENAME_COORDS.items() if k in data.coords})
         data = super().postprocess_final(data, scan_desc)
 
-        # microns to mm
+        # microns to mm. The coordinates are shared by the spectra, so they are rescaled once on
+        # the dataset, while the attrs of each spectrum are their own.
+        data = data.assign_coords({c: data.coords[c] / 1000 for c in self.MICRON_COORDS})
         ls: list[XrTypes] = [data, *[dv for dv in data.data_vars.values() if "eV" in dv.dims]]
-        for c in [
-            "short_x",
-            "short_y",
-            "short_z",
-            "physical_long_x",
-            "physical_long_y",
-            "physical_long_z",
-        ]:
-            for a_data in ls:
+        for a_data in ls:
+            for c in self.MICRON_COORDS:
                 if c in a_data.attrs:
                     a_data.attrs[c] = a_data.attrs[c] / 1000
 
-                a_data.coords[c] = a_data.coords[c] / 1000
-
         data = MAESTRONanoARPESEndstation.update_hierarchical_coordinates(data)
         if data.attrs["daq_type"] == "MotorSerpentine":
             data = MAESTRONanoARPESEndstation.unwind_serptentine(data)
 
-        # we return new data from update_hierarchical, so we need to refresh
+        deg_to_rad_coords = ("theta", "psi", "beta")
+        data = data.assign_coords(
+            alpha=np.pi / 2,
+            phi=data.coords["phi"] / 2,
+            **{c: np.deg2rad(data.coords[c]) for c in deg_to_rad_coords},
+        )
+
+        # we return new data from update_hierarchical and assign_coords, so we need to refresh
         # the definition of ls
         ls = [data, *[dv for dv in data.data_vars.values() if "eV" in dv.dims]]
         for a_data in ls:
-            a_data.coords["alpha"] = np.pi / 2
             a_data.attrs["alpha"] = np.pi / 2
-
             a_data.attrs["phi_offset"] = 0.4
-
-            a_data.coords["phi"] = a_data.coords["phi"] / 2
-
-        for deg_to_rad_coord in ["theta", "psi", "beta"]:
-            for a_data in ls:
-                a_data.coords[deg_to_rad_coord] = np.deg2rad(a_data.coords[deg_to_rad_coord])
-                if deg_to_rad_coord in a_data.attrs:
-                    a_data.attrs[deg_to_rad_coord] = np.deg2rad(a_data.attrs[deg_to_rad_coord])
+            for c in deg_to_rad_coords:
+                if c in a_data.attrs:
+                    a_data.attrs[c] = np.deg2rad(a_data.attrs[c])
 
         return data
@@ -5,12 +5,13 @@ from __future__ import annotations
 import operator
 import warnings
 from logging import DEBUG, INFO, WARNING, Formatter, StreamHandler, getLogger
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 import lmfit as lf
 import numpy as np
 import xarray as xr
 from lmfit.models import GaussianModel
+from scipy import signal
 
 if TYPE_CHECKING:
     from collections.abc import Hashable, Sequence
@@ -28,13 +29,28 @@ __all__ = ("XModelMixin", "gaussian_convolve")
 LOGLEVEL = (DEBUG, INFO, WARNING)[1]
 logger = getLogger(__name__)
 fmt = "%(asctime)s %(levelname)s %(name)s :%(message)s"
-formatter = Formatter(fmt)
-handler = StreamHandler()
-handler.setLevel(LOGLEVEL)
 logger.setLevel(LOGLEVEL)
-handler.setFormatter(formatter)
-logger.addHandler(handler)
 logger.propagate = False
+if not logger.handlers:  # reloading the module must not add a second handler
+    handler = StreamHandler()
+    handler.setLevel(LOGLEVEL)
+    handler.setFormatter(Formatter(fmt))
+    logger.addHandler(handler)
+
+# above this many products (len(a) * len(v)) an FFT convolution beats the direct sum
+FFT_CONVOLUTION_SIZE = 2**20
+
+
+class FitPlan(NamedTuple):
+    """How the dimensions of a DataArray map onto those of a multidimensional model.
+
+    This depends only on the dimension names of the data, so it is resolved once per model and
+    reused by every fit of a broadcast.
+    """
+
+    new_dim_order: tuple[str, ...]
+    # the permutation taking the axes of the data to new_dim_order, None if they already match
+    axes: tuple[int, ...] | None
 
 
 def _prep_parameters(
@@ -61,12 +77,11 @@ def _prep_parameters(
             params['yvar'] = Parameter(name='yvar', expr='1.0 - xvar')
     """
     if dict_of_parameters is None:
-        return _prep_parameters({})
+        return lf.Parameters()
     if isinstance(dict_of_parameters, lf.Parameters):
         return dict_of_parameters
     params = lf.Parameters()
-    for v in dict_of_parameters.values():
-        assert "name" not in v
+    # a "name" in the ParametersArgs clashes with param_name and raises TypeError here
     for param_name, param in dict_of_parameters.items():
         params[param_name] = lf.Parameter(param_name, **param)
     return params
@@ -152,8 +167,10 @@ class XModelMixin(lf.Model):
 
         params = _prep_parameters(params)
         assert isinstance(params, lf.Parameters)
-        logger.debug(f"param_type_ {type(params).__name__!r}")
+        logger.debug("param_type_ %r", type(params).__name__)
 
+        # a guess is thrown away when params provides every parameter (e.g. a warm start)
+        guess = guess and not set(self.param_names).issubset(params.keys())
         guessed_params: lf.Parameters = (
             self.guess(real_data, **coord_values) if guess else self.make_params()
         )
@@ -241,9 +258,9 @@ class XModelMixin(lf.Model):
         """
         if self.n_dims == 1:
             return xr_weights.values
-        if new_dim_order is not None:
-            return xr_weights.transpose(*new_dim_order).values.ravel()
-        return xr_weights.values.ravel()
+        if new_dim_order is not None and tuple(new_dim_order) != xr_weights.dims:
+            xr_weights = xr_weights.transpose(*new_dim_order)
+        return np.ascontiguousarray(xr_weights.values).reshape(-1)
 
     def _real_data_etc_from_xarray(
         self,
@@ -265,47 +282,71 @@ class XModelMixin(lf.Model):
         real_data, flat_data = data.values, data.values
         assert len(real_data.shape) == self.n_dims
         coord_values = {}
-        new_dim_order: list[str] = []
+        new_dim_order: tuple[str, ...] = ()
         if self.n_dims == 1:
-            coord_values["x"] = data.coords[next(iter(data.indexes))].values
+            # the index of the only dimension, looked up directly rather than by iterating
+            # over all of data.indexes
+            coord_values["x"] = data.indexes[data.dims[0]].values
         else:
-
-            def find_appropriate_dimension(dim_or_dim_list: str | list[str]) -> str:
-                assert isinstance(data, xr.DataArray)
-                if isinstance(dim_or_dim_list, str):
-                    assert dim_or_dim_list in data.dims
-                    return dim_or_dim_list
-                intersect = set(dim_or_dim_list).intersection(data.dims)
-                assert len(intersect) == 1
-                return next(iter(intersect))
-
-            # resolve multidimensional parameters
-            if all(d is None for d in self.dimension_order):
-                new_dim_order = [str(dim) for dim in data.dims]
-            else:
-                new_dim_order = [
-                    find_appropriate_dimension(dim_options)
-                    for dim_options in self.dimension_order
-                    if dim_options is not None
-                ]
-
-            if new_dim_order != list(data.dims):
+            plan = self._fit_plan(data)
+            new_dim_order = plan.new_dim_order
+            values = data.values
+            if plan.axes is not None:
                 warnings.warn("Transposing data for multidimensional fit.", stacklevel=2)
-                data = data.transpose(*new_dim_order)
+                values = values.transpose(plan.axes)
 
             coord_values = {str(k): v.values for k, v in data.coords.items() if k in new_dim_order}
-            real_data, flat_data = data.values, data.values.ravel()
+            # one copy at most (after a transpose), shared by real_data and its flat view
+            real_data = np.ascontiguousarray(values)
+            flat_data = real_data.reshape(-1)
 
             assert isinstance(flat_data, np.ndarray)
             assert isinstance(real_data, np.ndarray)
         return real_data, flat_data, coord_values, new_dim_order
 
+    def _fit_plan(self, data: xr.DataArray) -> FitPlan:
+        """Resolves (and memoizes per dimension names) the dimension order of the fit.
+
+        Args:
+            data: (xr.DataArray) data to be fit by this multidimensional model
+
+        Returns:
+            The FitPlan for data.
+        """
+        # not set in __init__: the attribute does not survive lmfit's (de)serialization
+        plans: dict[tuple[Hashable, ...], FitPlan] = self.__dict__.setdefault("_fit_plans", {})
+        if data.dims in plans:
+            return plans[data.dims]
+
+        def find_appropriate_dimension(dim_or_dim_list: str | list[str]) -> str:
+            if isinstance(dim_or_dim_list, str):
+                assert dim_or_dim_list in data.dims
+                return dim_or_dim_list
+            intersect = set(dim_or_dim_list).intersection(data.dims)
+            assert len(intersect) == 1
+            return next(iter(intersect))
+
+        # resolve multidimensional parameters
+        if all(d is None for d in self.dimension_order):
+            new_dim_order = tuple(str(dim) for dim in data.dims)
+        else:
+            new_dim_order = tuple(
+                find_appropriate_dimension(dim_options)
+                for dim_options in self.dimension_order
+                if dim_options is not None
+            )
+        axes = tuple(data.dims.index(dim) for dim in new_dim_order)
+        plans[data.dims] = FitPlan(new_dim_order, None if new_dim_order == data.dims else axes)
+        return plans[data.dims]
+
 
 class XCompositModelMixin(lf.CompositeModel):
     """A mixin providing curve fitting for ``xarray.DataArray`` instances."""
 
     n_dims = 1
     dimension_order: ClassVar[list[str | None]] = [None]
+    # prefixes of the components which are left at their default parameters by guess
+    unguessed_prefixes: ClassVar[tuple[str, ...]] = ()
 
     def guess(
         self,
@@ -314,12 +355,11 @@ class XCompositModelMixin(lf.CompositeModel):
         **kwargs: Incomplete,
     ) -> lf.Parameters:
         pars = self.make_params()
-        guessed = {}
         for c in self.components:
-            guessed.update(c.guess(data, x=x, **kwargs))
+            if c.prefix in self.unguessed_prefixes:
+                continue
 
-        for k, v in guessed.items():
-            pars[k] = v
+            pars.update(c.guess(data, x=x, **kwargs))
 
         return pars
 
@@ -338,28 +378,17 @@ class XMultiplicativeCompositeModel(XCompositModelMixin, XModelMixin):
 class XConvolutionCompositeModel(XCompositModelMixin, XModelMixin):
     """Work in progress for convolving two ``Model``."""
 
-    def guess(
-        self,
-        data: XrTypes,
-        x: NDArray[np.float64] | None = None,
-        **kwargs: Incomplete,
-    ) -> lf.Parameters:
-        pars = self.make_params()
-        guessed = {}
+    # don't guess on the convolution term
+    unguessed_prefixes: ClassVar[tuple[str, ...]] = ("conv_",)
 
-        for c in self.components:
-            if c.prefix == "conv_":
-                # don't guess on the convolution term
-                continue
 
-            guessed.update(c.guess(data, x=x, **kwargs))
-
-        for k, v in guessed.items():
-            pars[k] = v
-
-        return pars
+def _convolve(a: NDArray[np.float64], v: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Same as np.convolve, but through an FFT when the direct sum would be costly."""
+    if len(a) * len(v) > FFT_CONVOLUTION_SIZE:
+        return signal.fftconvolve(a, v)
+    return np.convolve(a, v)
 
 
 def gaussian_convolve(model_instance: Incomplete) -> lf.Model:
     """Produces a model that consists of convolution with a Gaussian kernel."""
-    return XConvolutionCompositeModel(model_instance, GaussianModel(prefix="conv_"), np.convolve)
+    return XConvolutionCompositeModel(model_instance, GaussianModel(prefix="conv_"), _convolve)
@@ -2,43 +2,107 @@
 
 We keep a pool alive after one is requested at the cost of memory overhead
 because otherwise pools are too slow due to heavy analysis imports (scipy, etc.).
+
+The workers import the fitting stack once when they start, which matters when they are not
+forked from the analysis session (see `HotPool.start_method`).
 """
 
 from __future__ import annotations
 
-from multiprocessing import Pool, pool
+import os
+import weakref
+from multiprocessing import get_context, pool
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
 
 __all__ = ["hot_pool"]
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _warm_up() -> None:
+    """Imports the fitting stack in a fresh worker, so that the first task does not pay for it."""
+    import arpes.fits  # noqa: F401, PLC0415
+
+
+def _close_pool(running_pool: pool.Pool) -> None:
+    """Lets the workers finish their tasks and waits for them to exit."""
+    running_pool.close()
+    running_pool.join()
+
 
 class HotPool:
+    """Holds the pool shared by the process parallel parts of PyARPES.
+
+    Call `reset` after changing the attributes on a pool which has already been started.
+
+    Attributes:
+        n_workers: The number of worker processes. `os.cpu_count()` if None.
+        start_method: The multiprocessing start method, the platform default if None.
+            "forkserver" avoids forking a large session with its memory, but then everything
+            sent to the workers must be importable: functions and models defined in a notebook
+            are not.
+    """
+
     _pool: pool.Pool | None = None
+    _finalizer: weakref.finalize | None = None
+    n_workers: int | None = None
+    start_method: str | None = None
 
     @property
     def pool(self) -> pool.Pool:
-        """[TODO:summary].
-
-        Args:
-            self ([TODO:type]): [TODO:description]
+        """The pool, which is started on first access.
 
         Returns:
-            [TODO:description]
+            The running multiprocessing pool.
         """
         if self._pool is not None:
             return self._pool
 
-        self._pool = Pool()
+        self._pool = get_context(self.start_method).Pool(
+            processes=self.n_workers,
+            initializer=_warm_up,
+        )
+        # also runs at interpreter exit, which __del__ is not guaranteed to
+        self._finalizer = weakref.finalize(self, _close_pool, self._pool)
         return self._pool
 
-    def __del__(self) -> None:
-        """[TODO:summary].
+    def map_fits(
+        self,
+        func: Callable[[T], R],
+        jobs: Iterable[T],
+        *,
+        total: int | None = None,
+        chunksize: int | None = None,
+    ) -> Iterator[R]:
+        """Maps func over jobs on the pool, yielding the results in completion order.
+
+        `func` is pickled once per chunk of jobs rather than once per job, which matters when it
+        closes over the data, as the workers of the broadcast fits do.
+
+        Args:
+            func: The function to apply, typically a worker closing over a model and its data.
+            jobs: The arguments, one per call.
+            total: The number of jobs, used to size the chunks when `chunksize` is not given.
+            chunksize: The number of jobs sent to a worker at once.
 
         Returns:
-            [TODO:description]
+            An iterator over the results, in no particular order.
         """
-        if self._pool is not None:
-            self._pool.close()
-            self._pool = None
+        if chunksize is None:
+            n_workers = self.n_workers or os.cpu_count() or 1
+            chunksize = max(1, (total or 0) // (4 * n_workers))
+        return self.pool.imap_unordered(func, jobs, chunksize=chunksize)
+
+    def reset(self) -> None:
+        """Shuts the pool down. The next access to `pool` starts a new one."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._pool = None
 
 
 hot_pool = HotPool()
@@ -234,10 +234,9 @@ def broadcast_model(  # noqa: PLR0913
     if parallelize:
         logger.debug(f"Running fits (nfits={n_fits}) in parallel (n_threads={cpu_count()})")
 
-        pool = hot_pool.pool
         exe_results = list(
             wrap_progress(
-                pool.imap(fitter, results.G.iter_coords()),  # IMapIterator
+                hot_pool.map_fits(fitter, results.G.iter_coords(), total=int(n_fits)),
                 total=int(n_fits),
                 desc="Fitting on pool...",
             ),
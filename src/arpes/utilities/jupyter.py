@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import json
 import urllib.request
 from datetime import UTC
@@ -10,14 +11,10 @@ from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
 from os import SEEK_END
 from pathlib import Path
 from typing import TYPE_CHECKING, Required, TypedDict, TypeVar
-from urllib.error import HTTPError
+from urllib.error import URLError
 
-import ipykernel
 from IPython.core.getipython import get_ipython
 from IPython.core.interactiveshell import InteractiveShell
-from jupyter_server import serverapp
-from tqdm.notebook import tqdm
-from traitlets.config import MultipleInstanceError
 
 from arpes.config import CONFIG
 
@@ -38,13 +35,13 @@ LOGLEVELS = (DEBUG, INFO)
 LOGLEVEL = LOGLEVELS[1]
 logger = getLogger(__name__)
 fmt = "%(asctime)s %(levelname)s %(name)s :%(message)s"
-formatter = Formatter(fmt)
-handler = StreamHandler()
-handler.setLevel(LOGLEVEL)
 logger.setLevel(LOGLEVEL)
-handler.setFormatter(formatter)
-logger.addHandler(handler)
 logger.propagate = False
+if not logger.handlers:  # reloading the module must not add a second handler
+    handler = StreamHandler()
+    handler.setLevel(LOGLEVEL)
+    handler.setFormatter(Formatter(fmt))
+    logger.addHandler(handler)
 
 T = TypeVar("T")
 
@@ -59,6 +56,9 @@ def wrap_tqdm(
     if not interactive:
         return x
 
+    # imported on use: the notebook frontend of tqdm pulls in ipywidgets
+    from tqdm.auto import tqdm  # noqa: PLC0415
+
     return tqdm(x, *args, **kwargs)
 
 
@@ -89,26 +89,35 @@ class NoteBookInfomation(TypedDict, total=True):
     session: SessionInfo
 
 
+@functools.cache
 def get_full_notebook_information() -> NoteBookInfomation | None:
     """Javascriptless method to fetch current notebook sessions and the one matching this kernel.
 
+    The kernel does not change servers or sessions, so the result is cached for the lifetime of
+    the process. Use `get_full_notebook_information.cache_clear()` to look again.
+
     Returns:
         [TODO:description]
 
     Raises:
         ValueError: [TODO:description]
     """
+    # imported on use, these are only needed (and only cheap to have loaded) inside Jupyter
+    import ipykernel  # noqa: PLC0415
+    from jupyter_server import serverapp  # noqa: PLC0415
+    from traitlets.config import MultipleInstanceError  # noqa: PLC0415
+
     try:
         connection_file = Path(ipykernel.get_connection_file()).stem
     except (MultipleInstanceError, RuntimeError):
         return None
 
-    logger.debug(f"connection_file: {connection_file}")
+    logger.debug("connection_file: %s", connection_file)
     kernel_id = connection_file.split("-", 1)[1] if "-" in connection_file else connection_file
 
     servers = serverapp.list_running_servers()
     for server in servers:
-        logger.debug(f"server: {server}")
+        logger.debug("server: %s", server)
         try:
             passwordless = not server["token"] and not server["password"]
             url = (
@@ -119,7 +128,7 @@ def get_full_notebook_information() -> NoteBookInfomation | None:
             if not url.startswith(("http:", "https:")):
                 msg = "URL must start with 'http:' or 'https:'"
                 raise ValueError(msg)
-            sessions = json.load(urllib.request.urlopen(url))  # noqa: S310
+            sessions = json.load(urllib.request.urlopen(url, timeout=2))  # noqa: S310
             for sess in sessions:
                 if sess["kernel"]["id"] == kernel_id:
                     return {
@@ -128,7 +137,7 @@ def get_full_notebook_information() -> NoteBookInfomation | None:
                     }
         except (KeyError, TypeError):
             pass
-        except HTTPError:
+        except (URLError, TimeoutError):
             logger.debug("Could not read notebook information")
     return None
 
@@ -188,17 +197,21 @@ def get_recent_logs(n_bytes: int = 1000) -> list[str]:
             with Path(logging_file).open("rb") as file:
                 try:
                     file.seek(-n_bytes, SEEK_END)
+                    truncated = True
                 except OSError:
                     file.seek(0)
+                    truncated = False
 
-                lines = file.readlines()
+                lines = file.read().decode(errors="replace").splitlines(keepends=True)
+            if truncated:  # the window starts within a line
+                lines = lines[1:]
 
             # ensure we get the most recent information
             final_cell = ipython.history_manager.get_tail(  # type: ignore [union-attr]
                 n=1,
                 include_latest=True,
             )[0][-1]
-            return [_.decode() for _ in lines] + [final_cell]
+            return [*lines, final_cell]
 
     except (AttributeError, AssertionError):
         pass
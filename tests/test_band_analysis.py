@@ -0,0 +1,144 @@
+"""Unit test for band analysis."""
+
+import itertools
+from types import SimpleNamespace
+
+import lmfit as lf
+import numpy as np
+import pytest
+import xarray as xr
+from arpes.analysis.band_analysis import (
+    SMALL_ASSIGNMENT_SIZE,
+    _best_assignment,
+    _identified_band_results,
+    fit_patterned_bands,
+)
+from arpes.models.band import Band
+
+
+@pytest.fixture
+def dispersive_cut() -> xr.DataArray:
+    """A Lorentzian band dispersing linearly in (eV, phi), with noise."""
+    eV = np.linspace(-0.3, 0, 6)
+    phi = np.linspace(-0.2, 0.2, 81)
+    centers = 0.05 + 0.2 * eV
+    values = 100 / (1 + ((phi[np.newaxis, :] - centers[:, np.newaxis]) / 0.02) ** 2) + 5
+    values += np.random.default_rng(0).normal(0, 0.5, values.shape)
+    return xr.DataArray(values, coords={"eV": eV, "phi": phi}, dims=("eV", "phi"))
+
+
+def _band_set(params: dict, band: type[Band] = Band) -> dict:
+    return {
+        "a": {
+            "name": "a",
+            "band": band,
+            "dims": ("eV",),
+            "params": params,
+            "points": [(-0.3, -0.01), (0.0, 0.05)],
+        },
+    }
+
+
+def test_fit_patterned_bands_with_band_stray(dispersive_cut: xr.DataArray) -> None:
+    """A band may set its own "stray" among its params."""
+    fit_results = fit_patterned_bands(
+        dispersive_cut,
+        _band_set({"stray": 0.05}),
+        fit_direction="phi",
+        interactive=False,
+        parallelize=False,
+    )
+    centers = [result.params["a_0center"].value for result in fit_results.results.values]
+    np.testing.assert_allclose(centers, 0.05 + 0.2 * dispersive_cut.eV.values, atol=2e-3)
+    assert float(np.abs(fit_results.residual).sum()) == pytest.approx(189.342, rel=1e-3)
+
+
+def test_fit_patterned_bands_parallel_matches_serial(dispersive_cut: xr.DataArray) -> None:
+    """Fitting the marginals on the process pool gives the serial results."""
+
+    class LocalBand(Band):
+        """Defined after the pool may have started, so only dill can send it to the workers."""
+
+    fits = [
+        fit_patterned_bands(
+            dispersive_cut,
+            _band_set({}, band=LocalBand),
+            fit_direction="phi",
+            interactive=False,
+            parallelize=parallelize,
+        )
+        for parallelize in (False, True)
+    ]
+    serial, parallel = fits
+    np.testing.assert_allclose(parallel.residual.values, serial.residual.values)
+    for serial_result, parallel_result in zip(
+        serial.results.values.flat,
+        parallel.results.values.flat,
+        strict=True,
+    ):
+        assert parallel_result.params.valuesdict() == pytest.approx(
+            serial_result.params.valuesdict(),
+        )
+
+
+@pytest.mark.parametrize(
+    "size",
+    [1, 2, 3, 4, SMALL_ASSIGNMENT_SIZE, SMALL_ASSIGNMENT_SIZE + 1, SMALL_ASSIGNMENT_SIZE + 2],
+)
+def test_best_assignment_matches_brute_force(size: int) -> None:
+    """Either side of the cutoff, the assignment has the smallest total distance of all."""
+    rng = np.random.default_rng(size)
+    for _ in range(20):
+        dist_mat = rng.uniform(0, 1, (size, size))
+        best_arrangement = _best_assignment(dist_mat)
+        assert sorted(best_arrangement) == list(range(size))
+        brute_force_cost = min(
+            dist_mat[np.arange(size), list(p)].sum() for p in itertools.permutations(range(size))
+        )
+        assert dist_mat[np.arange(size), best_arrangement].sum() == pytest.approx(
+            brute_force_cost,
+        )
+
+
+def _fake_result(bands: dict[str, tuple[float, float]]) -> SimpleNamespace:
+    """Stands in for a ModelResult whose bands have the given weighted (width, center)."""
+    params = lf.Parameters()
+    for prefix, (weighted_width, weighted_center) in bands.items():
+        # undo the default weights (2, 0, 10) of the sigma, amplitude and center
+        for name, value in (
+            ("sigma", weighted_width / 2),
+            ("amplitude", 1.0),
+            ("center", weighted_center / 10),
+        ):
+            params.add(prefix + name, value=value)
+            params[prefix + name].stderr = 0.0
+    components = [SimpleNamespace(prefix=prefix) for prefix in bands]
+    return SimpleNamespace(model=SimpleNamespace(components=components), params=params)
+
+
+def test_identified_band_results_follow_nearest_point() -> None:
+    """Bands are identified against the nearest labelled point, not the first one.
+
+    Band p goes from (0, 0) to (10, 0) along an upper arc while band q comes back along the lower
+    one. At x=2, p is where q was at x=-2, which ranking the previous points by their dot product
+    with the coordinate picked. The fit labels the bands the other way around at x=1.
+    """
+    p = [(0, 0), (3, 4), (7, 4), (10, 0)]
+    q = [(10, 0), (7, -4), (3, -4), (0, 0)]
+    results = [
+        _fake_result({"a_": p[0], "b_": q[0]}),
+        _fake_result({"a_": p[1], "b_": q[1]}),
+        _fake_result({"a_": q[2], "b_": p[2]}),
+        _fake_result({"a_": p[3], "b_": q[3]}),
+    ]
+    band_results = xr.DataArray(
+        np.array(results, dtype=object),
+        coords={"x": [-2.0, -1.0, 1.0, 2.0]},
+        dims=("x",),
+    )
+    assert _identified_band_results(band_results).tolist() == [
+        ["a_", "b_"],
+        ["a_", "b_"],
+        ["b_", "a_"],
+        ["a_", "b_"],
+    ]
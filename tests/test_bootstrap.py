@@ -0,0 +1,110 @@
+"""Unit test for the statistical bootstraps."""
+
+from collections.abc import Iterator
+
+import numba
+import numpy as np
+import pytest
+import xarray as xr
+from arpes import bootstrap as bootstrap_module
+from arpes.bootstrap import bootstrap
+
+
+@numba.njit
+def _seed_numba(seed: int) -> None:
+    """Seeds the generator of numba, which is separate from the one of numpy."""
+    np.random.seed(seed)  # noqa: NPY002
+
+
+@pytest.fixture
+def numba_single_thread() -> Iterator[None]:
+    """Runs the numba kernels on the seeded thread only, so that their draws are reproducible."""
+    n_threads = numba.get_num_threads()
+    numba.set_num_threads(1)
+    yield
+    numba.set_num_threads(n_threads)
+
+
+@pytest.fixture
+def counts() -> xr.DataArray:
+    """Electron counts on an (eV, phi) grid."""
+    lam = np.random.default_rng(1).uniform(0, 20, (12, 9))
+    return xr.DataArray(
+        lam,
+        coords={"eV": np.linspace(-0.2, 0, 12), "phi": np.linspace(-0.1, 0.1, 9)},
+        dims=("eV", "phi"),
+    )
+
+
+def test_resample_cycle_counts_matches_explicit_cycles() -> None:
+    """Summing the drawn cycles with their counts is the same as selecting and summing them."""
+    values = np.random.default_rng(2).uniform(0, 10, (6, 5, 4))
+    values[1, 2, 3] = np.nan
+    data = xr.DataArray(
+        values,
+        coords={"eV": np.linspace(-0.1, 0, 6), "cycle": np.arange(5), "phi": np.arange(4)},
+        dims=("eV", "cycle", "phi"),
+    )
+    counts = bootstrap_module._draw_cycle_counts(5, 8, np.random.default_rng(0))
+    assert counts.shape == (8, 5)
+    np.testing.assert_array_equal(counts.sum(axis=1), 5)
+    resampled = bootstrap_module._resample_cycle_counts(data, counts)
+    assert resampled.dims == ("bootstrap", "eV", "phi")
+    for j, cycle_counts in enumerate(counts):
+        which = np.repeat(np.arange(5), cycle_counts)
+        np.testing.assert_allclose(
+            resampled.isel(bootstrap=j).values,
+            data.isel(cycle=which).sum("cycle").values,
+        )
+
+
+@pytest.mark.parametrize("n", [1, 7, 20])
+def test_bootstrap_parallel_matches_serial(counts: xr.DataArray, n: int) -> None:
+    """The samples are drawn in the main process, so the pool does not change the results."""
+    bootstrapped = bootstrap(lambda arr, scale: scale * arr.sum("phi"))
+    serial, parallel = (
+        bootstrapped(counts, 2, n=n, rng=np.random.default_rng(0), parallelize=parallelize)
+        for parallelize in (False, True)
+    )
+    assert serial.sizes["bootstrap"] == n
+    xr.testing.assert_identical(parallel, serial)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10, 23, 64])
+def test_poisson_mean_std_matches_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+    chunk_size: int,
+) -> None:
+    """The statistics merged chunk by chunk are those of all the draws at once."""
+    lam = np.random.default_rng(1).uniform(0, 30, (4, 5))
+    draws = np.random.default_rng(5).poisson(lam, size=(23, *lam.shape))
+    monkeypatch.setattr(bootstrap_module, "_RNG", np.random.default_rng(5))
+    mean, std = bootstrap_module._poisson_mean_std(lam, n_samples=23, chunk_size=chunk_size)
+    np.testing.assert_allclose(mean, draws.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(std, draws.std(axis=0), rtol=1e-12)
+
+
+@pytest.mark.usefixtures("numba_single_thread")
+def test_poisson_numba_matches_numpy() -> None:
+    """One draw per channel, the same as the seeded legacy numpy generator."""
+    lam = np.random.default_rng(1).uniform(0, 200, 37)
+    out = np.empty(lam.shape, dtype=np.int64)
+    _seed_numba(3)
+    bootstrap_module._poisson_numba(lam, out)
+    np.random.seed(3)  # noqa: NPY002
+    np.testing.assert_array_equal(out, np.random.poisson(lam))  # noqa: NPY002
+
+
+@pytest.mark.usefixtures("numba_single_thread")
+@pytest.mark.parametrize("n_samples", [1, 2, 200])
+def test_poisson_mean_std_numba_matches_numpy(n_samples: int) -> None:
+    """The running statistics of each channel are those of its seeded legacy numpy draws."""
+    lam = np.random.default_rng(1).uniform(0, 200, 37)
+    mean, std = np.empty(lam.shape), np.empty(lam.shape)
+    _seed_numba(3)
+    bootstrap_module._poisson_mean_std_numba(lam, n_samples, mean, std)
+    np.random.seed(3)  # noqa: NPY002
+    # the channels draw one after the other
+    draws = np.random.poisson(lam[:, np.newaxis], size=(len(lam), n_samples))  # noqa: NPY002
+    np.testing.assert_allclose(mean, draws.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(std, draws.std(axis=1), rtol=1e-12, atol=1e-12)
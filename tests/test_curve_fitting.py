@@ -1,15 +1,44 @@
 """Unit test for curve fitting."""
 
+from typing import ClassVar
+from unittest.mock import MagicMock
+
 import numpy as np
+import pytest
 import xarray as xr
 from arpes.analysis import rebin
 from arpes.fits import AffineBroadenedFD, LorentzianModel, broadcast_model
+from arpes.fits.fit_models import Gaussian2DModel
 from arpes.fits.utilities import parse_model
 
 RTOL = 5e-2  # 5 %
 TOLERANCE = 1e-2
 
 
+class XYGaussian2DModel(Gaussian2DModel):
+    """Gaussian2DModel fitting "x" first. Make it with both x and y as independent_vars."""
+
+    dimension_order: ClassVar[list[str | None]] = ["x", "y"]
+
+
+@pytest.fixture
+def gaussian_2d() -> xr.DataArray:
+    """An axis aligned 2D Gaussian on (x, y), with a little noise."""
+    x = np.linspace(-1, 1, 40)
+    y = np.linspace(-1, 1, 30)
+    values = XYGaussian2DModel(independent_vars=["x", "y"]).eval(
+        x=x,
+        y=y,
+        amplitude=2,
+        xc=0.1,
+        yc=-0.2,
+        sigma_x=0.2,
+        sigma_y=0.3,
+    )
+    values = values.reshape(40, 30) + np.random.default_rng(0).normal(0, 0.01, (40, 30))
+    return xr.DataArray(values, coords={"x": x, "y": y}, dims=("x", "y"))
+
+
 def test_parse_model() -> None:
     """Test parse_model."""
     assert parse_model(AffineBroadenedFD) == AffineBroadenedFD
@@ -131,3 +160,59 @@ def test_broadcast_fitting(dataarray_cut: xr.DataArray) -> None:
         ),
         rtol=RTOL,
     )
+
+
+def test_multidimensional_fit_in_both_dim_orders(gaussian_2d: xr.DataArray) -> None:
+    """Data given in the other dimension order is transposed to the order of the model."""
+    model = XYGaussian2DModel(independent_vars=["x", "y"])
+    transposed = gaussian_2d.transpose("y", "x")
+    real_data, flat_data, coord_values, new_dim_order = model._real_data_etc_from_xarray(
+        gaussian_2d,
+    )
+    with pytest.warns(UserWarning, match="Transposing data"):
+        transposed_etc = model._real_data_etc_from_xarray(transposed)
+    # the same as the previous DataArray.transpose to the dimension order of the model
+    np.testing.assert_array_equal(transposed_etc[0], transposed.transpose("x", "y").values)
+    np.testing.assert_array_equal(transposed_etc[0], real_data)
+    np.testing.assert_array_equal(transposed_etc[1], flat_data)
+    assert transposed_etc[1].flags.c_contiguous
+    assert transposed_etc[2].keys() == coord_values.keys()
+    for dim, coord in coord_values.items():
+        np.testing.assert_array_equal(transposed_etc[2][dim], coord)
+    assert tuple(transposed_etc[3]) == tuple(new_dim_order) == ("x", "y")
+
+    params = {
+        "amplitude": {"value": 1},
+        "xc": {"value": 0},
+        "yc": {"value": 0},
+        "sigma_x": {"value": 0.3},
+        "sigma_y": {"value": 0.3},
+    }
+    result = model.guess_fit(gaussian_2d, params=params, guess=False)
+    with pytest.warns(UserWarning, match="Transposing data"):
+        transposed_result = model.guess_fit(transposed, params=params, guess=False)
+    assert transposed_result.params.valuesdict() == pytest.approx(result.params.valuesdict())
+    assert result.params["xc"].value == pytest.approx(0.1, abs=1e-3)
+    assert result.params["yc"].value == pytest.approx(-0.2, abs=1e-3)
+    assert transposed_result.independent_order == ("x", "y")
+    # the dimension order is resolved once for each order of the data
+    assert model._fit_plan(transposed) is model._fit_plan(transposed)
+    assert model._fit_plan(gaussian_2d).axes is None
+    assert model._fit_plan(transposed).axes == (1, 0)
+
+
+def test_guess_skipped_when_params_are_complete(
+    gaussian_2d: xr.DataArray,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No guess is made when params give every parameter of the model, e.g. a warm start."""
+    model = XYGaussian2DModel(independent_vars=["x", "y"])
+    transposed = gaussian_2d.transpose("y", "x")
+    with pytest.warns(UserWarning, match="Transposing data"):
+        result = model.guess_fit(transposed, params={}, guess=False)
+    guess = MagicMock(wraps=model.guess)
+    monkeypatch.setattr(model, "guess", guess)
+    with pytest.warns(UserWarning, match="Transposing data"):
+        warm_result = model.guess_fit(transposed, params=result.params)
+    guess.assert_not_called()
+    assert warm_result.params.valuesdict() == pytest.approx(result.params.valuesdict(), abs=1e-8)
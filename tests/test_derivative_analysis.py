@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
+from scipy import ndimage
 from arpes.analysis import (
+    DerivativeCache,
     curvature1d,
     curvature2d,
     dn_along_axis,
@@ -131,3 +135,70 @@ class TestCurvature:
                 ],
             ),
         )
+
+    def test_minimum_gradient_sobel(self, dataarray_cut2: xr.DataArray) -> None:
+        """Test for minimum_gradient with the Sobel kernel."""
+        smoothed = gaussian_filter_arr(
+            arr=dataarray_cut2,
+            sigma={"eV": 0.01, "phi": 0.01},
+            repeat_n=3,
+        )
+        minimum_gradient_ = minimum_gradient(smoothed, kernel="sobel")
+        assert minimum_gradient_.S.is_differentiated
+        gx = ndimage.sobel(smoothed.values, axis=0)
+        gy = ndimage.sobel(smoothed.values, axis=1)
+        np.testing.assert_allclose(
+            minimum_gradient_.values,
+            smoothed.values / np.sqrt(gx**2 + gy**2),
+        )
+
+
+class TestDerivativeCache:
+    """Test class for reusing the derivatives across calls."""
+
+    @staticmethod
+    def smooth(arr: xr.DataArray) -> xr.DataArray:
+        """Smoothing function shared by the calls."""
+        return gaussian_filter_arr(arr, sigma={"eV": 0.01, "phi": 0.01})
+
+    def test_cached_results_match(self, dataarray_cut2: xr.DataArray) -> None:
+        """A cache shared by an alpha scan gives the uncached results."""
+        cache = DerivativeCache()
+        for alpha in (0.01, 0.1, 1):
+            np.testing.assert_allclose(
+                curvature2d(dataarray_cut2, alpha=alpha, smooth_fn=self.smooth, cache=cache),
+                curvature2d(dataarray_cut2, alpha=alpha, smooth_fn=self.smooth),
+            )
+            np.testing.assert_allclose(
+                curvature1d(dataarray_cut2, "eV", alpha, self.smooth, cache=cache),
+                curvature1d(dataarray_cut2, "eV", alpha, self.smooth),
+            )
+        np.testing.assert_allclose(
+            dn_along_axis(dataarray_cut2, "eV", self.smooth, order=1, cache=cache),
+            dn_along_axis(dataarray_cut2, "eV", self.smooth, order=1),
+        )
+        assert len(cache) == 1
+
+    def test_cache_releases_input(self, dataarray_cut2: xr.DataArray) -> None:
+        """The cache neither keeps its input alive nor holds entries for it afterwards."""
+        cache = DerivativeCache()
+        arr = dataarray_cut2.copy(deep=True)
+        arr_ref = weakref.ref(arr)
+        curvature1d(arr, "eV", smooth_fn=self.smooth, cache=cache)
+        curvature2d(arr, cache=cache)
+        assert len(cache) == 1
+        del arr
+        gc.collect()
+        assert arr_ref() is None
+        assert len(cache) == 0
+
+    def test_clear_after_inplace_change(self, dataarray_cut2: xr.DataArray) -> None:
+        """After clear, the results follow an in-place change of the input."""
+        cache = DerivativeCache()
+        arr = dataarray_cut2.copy(deep=True)
+        before = curvature2d(arr, cache=cache)
+        arr.values[:] = arr.values**2
+        np.testing.assert_allclose(curvature2d(arr, cache=cache), before)
+        cache.clear()
+        assert len(cache) == 0
+        np.testing.assert_allclose(curvature2d(arr, cache=cache), curvature2d(arr))